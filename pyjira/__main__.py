@@ -0,0 +1,24 @@
+"""
+Entry point for the pyjira console script and ``python -m pyjira``.
+
+``--version`` is answered here directly, before Click and the command
+modules are imported. Everything else, including ``--help`` (which lists
+the aliases from the user's config), is handed to the full CLI.
+"""
+
+import sys
+
+from . import __version__
+
+
+def main() -> None:
+    """Run the Jira CLI"""
+    if sys.argv[1:] == ['--version']:
+        print(f"pyjira, version {__version__}")
+        sys.exit(0)
+
+    from .cli import cli
+    cli()
+
+if __name__ == '__main__':
+    main()
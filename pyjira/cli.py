@@ -1,31 +1,219 @@
 # Core imports and setup
-import click
+# Heavy dependencies (the Jira client, Rich and the formatters) are imported
+# inside the commands that use them so that --help and argument errors stay fast.
+import functools
 import os
-from typing import Optional, List, Dict, Any, Tuple
-from .client import JiraClient
-from .config import load_config
-from pathlib import Path
-from .exceptions import JiraCliError
-from rich.console import Console
-from rich.table import Table
-from .formatters import IssueFormatter
-from rich.progress import Progress
-from rich.prompt import Confirm
-import json
-from datetime import datetime
+import shlex
+import string
+import sys
+from itertools import islice
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import click
 from click import Context
 
-console = Console()
+from . import __version__
+from .config import load_config
+from .exceptions import JiraApiError, JiraCliError
+
+# Issue fields shown by the list table
+_LIST_FIELDS: List[str] = ['summary', 'status', 'priority', 'assignee']
+
+# Lines written per echo call when printing tab-separated rows
+_PLAIN_OUTPUT_ROWS = 500
+
+# Units accepted by the log command's time spent argument
+_TIME_UNITS: FrozenSet[str] = frozenset('wdhm')
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Column, Table
+
+    from .formatters import IssueFormatter
+
+def _plain_output() -> bool:
+    """Check whether JIRA_CLI_PLAIN asks for plain text output without Rich styling"""
+    return bool(os.getenv('JIRA_CLI_PLAIN'))
+
+@functools.lru_cache(maxsize=None)
+def _console() -> 'Console':
+    """Get the shared Rich console, creating it on first use"""
+    from rich.console import Console
+    if _plain_output():
+        return Console(no_color=True, highlight=False, emoji=False)
+    return Console()
+
+def _handle_jira_errors(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Print Jira CLI errors raised by a command in red and exit with status 1"""
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except JiraCliError as e:
+            _console().print(f"[red]{str(e)}[/red]")
+            sys.exit(1)
+    return wrapper
+
+@functools.lru_cache(maxsize=None)
+def _formatter() -> 'IssueFormatter':
+    """Get the shared issue formatter, creating it on first use"""
+    from .formatters import IssueFormatter
+    return IssueFormatter()
+
+def _default_project() -> Optional[str]:
+    """Get JIRA_DEFAULT_PROJECT, after the client has loaded .env"""
+    return os.getenv('JIRA_DEFAULT_PROJECT')
+
+def _dumps_json(data: Any) -> Union[str, bytes]:
+    """Serialize data as indented JSON, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+def _make_table(columns: Sequence[Union[str, 'Column']], rows: Iterable[Sequence[str]]) -> 'Table':
+    """Build a table with a bold header from column headers and pre-built rows"""
+    from rich.table import Table
+    table = Table(*columns, show_header=True, header_style="bold")
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+def _echo_rows(rows: Iterable[Sequence[str]]) -> None:
+    """Print rows as tab-separated lines, writing _PLAIN_OUTPUT_ROWS lines at a time"""
+    lines = map('\t'.join, rows)
+    while True:
+        chunk = tuple(islice(lines, _PLAIN_OUTPUT_ROWS))
+        if not chunk:
+            break
+        click.echo('\n'.join(chunk))
+
+def _normalize_list_args(args: List[str]) -> List[str]:
+    """Convert alias arguments to Click's expected format, splitting '--opt=value' pairs"""
+    formatted_args: List[str] = []
+    for arg in args:
+        if arg[:2] == '--' and '=' in arg:
+            opt, _, val = arg.partition('=')
+            formatted_args += [opt, val]
+        else:
+            formatted_args.append(arg)
+    return formatted_args
+
+# Aliases are registered on the first lookup of a name that is not a built-in
+# command (or when listing commands) rather than at import time
+_aliases_loaded = False
+
+# A compiled alias argument: (literal text, placeholder name or None) pieces
+_Template = List[Tuple[str, Optional[str]]]
+
+# Alias name -> (target command name, resolved target command, pre-tokenized alias args,
+# compiled templates for the args containing {placeholders} by index), built once when
+# aliases are loaded so run() does no per-call parsing
+_ALIAS_TARGETS: Dict[str, Tuple[str, Optional[click.Command], List[str], Dict[int, _Template]]] = {}
+
+# Alias name -> why its command could not be parsed, reported only when the alias is run
+_ALIAS_ERRORS: Dict[str, str] = {}
 
-def get_alias_command(alias_name: str) -> Optional[str]:
-    """Get the command for an alias from config"""
-    config = load_config()
-    aliases = config.get('aliases', {})
-    return aliases.get(alias_name)
+def _compile_placeholders(arg: str) -> Optional[_Template]:
+    """Split an alias argument into literal text and placeholder names, or None if it is plain text"""
+    try:
+        template = [(literal, field) for literal, field, _, _ in string.Formatter().parse(arg)]
+    except ValueError:
+        # Unbalanced braces are literal text, e.g. in a JQL string
+        return None
+    if all(field is None for _, field in template) and ''.join(literal for literal, _ in template) == arg:
+        return None
+    return template
+
+class LazyAliasGroup(click.Group):
+    """Click group that registers config aliases only once a lookup needs them"""
+
+    _commands_snapshot: Optional[FrozenSet[str]] = None
+
+    def _load_aliases(self) -> None:
+        """Register aliases from config as commands, once per process"""
+        global _aliases_loaded
+        if _aliases_loaded:
+            return
+        _aliases_loaded = True
+        # Built-in commands take precedence over aliases with the same name,
+        # whether invoked directly or through run
+        aliases = {
+            alias_name: alias_command
+            for alias_name, alias_command in load_config().get('aliases', {}).items()
+            if alias_name not in self.commands
+        }
+        for alias_name in aliases:
+            create_alias_command(alias_name)
+        
+        for alias_name, alias_command in aliases.items():
+            # Split the alias command into parts, removing shell-style quotes.
+            # A broken alias must not break --help or other commands, so its
+            # error is kept until someone runs it.
+            if not isinstance(alias_command, str):
+                _ALIAS_ERRORS[alias_name] = f"Invalid alias '{alias_name}': expected a command string"
+                continue
+            try:
+                parts = shlex.split(alias_command)
+            except ValueError as e:
+                _ALIAS_ERRORS[alias_name] = f"Invalid alias '{alias_name}': {e}"
+                continue
+            if not parts:
+                _ALIAS_ERRORS[alias_name] = f"Invalid alias '{alias_name}': no command given"
+                continue
+            command_name, fixed_args = parts[0], parts[1:]
+            # For the list command, ensure arguments are properly formatted
+            if command_name == 'list':
+                fixed_args = _normalize_list_args(fixed_args)
+            placeholders: Dict[int, _Template] = {}
+            for i, arg in enumerate(fixed_args):
+                template = _compile_placeholders(arg) if '{' in arg else None
+                if template:
+                    placeholders[i] = template
+            _ALIAS_TARGETS[alias_name] = (command_name, self.commands.get(command_name), fixed_args, placeholders)
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        self._load_aliases()
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Optional[click.Command]:
+        # Built-in commands resolve without reading the config
+        command = super().get_command(ctx, cmd_name)
+        if command is None and not _aliases_loaded:
+            self._load_aliases()
+            command = super().get_command(ctx, cmd_name)
+        return command
+
+    def add_command(self, cmd: click.Command, name: Optional[str] = None) -> None:
+        super().add_command(cmd, name)
+        # Invalidate the snapshot whenever a command or alias is registered
+        self._commands_snapshot = None
+
+    def command_names(self) -> FrozenSet[str]:
+        """Get the names of all commands, including aliases, as a cached frozenset"""
+        self._load_aliases()
+        if self._commands_snapshot is None:
+            self._commands_snapshot = frozenset(self.commands)
+        return self._commands_snapshot
 
 # Main CLI group
-@click.group(invoke_without_command=True)
-@click.version_option(version="1.0.0")
+@click.group(cls=LazyAliasGroup, invoke_without_command=True)
+@click.version_option(version=__version__, prog_name="pyjira")
 @click.option('--debug', is_flag=True, help='Enable debug mode')
 @click.pass_context
 def cli(ctx: Context, debug: bool) -> None:
@@ -42,111 +230,97 @@ def cli(ctx: Context, debug: bool) -> None:
 @click.argument('args', nargs=-1)
 def run(command_or_alias: str, args: Tuple[str, ...]) -> None:
     """Run a command or alias"""
-    alias_command = get_alias_command(command_or_alias)
-    if alias_command:
-        # Split the alias command into parts and handle quotes properly
-        parts = []
-        current_part = ''
-        in_quotes = False
-        
-        for char in alias_command:
-            if char == '"':
-                in_quotes = not in_quotes
-                current_part += char
-            elif char == ' ' and not in_quotes:
-                if current_part:
-                    parts.append(current_part)
-                current_part = ''
-            else:
-                current_part += char
-        
-        if current_part:
-            parts.append(current_part)
-        
-        command_name = parts[0]
-        command_args = parts[1:]  # Keep quotes intact
-        
-        # Add any additional args passed to the command
-        command_args.extend(args)
-        
-        if command_name in cli.commands:
-            ctx = click.get_current_context()
-            # Create a new context for the command
-            with ctx.scope(cleanup=False):
-                # For the list command, ensure arguments are properly formatted
-                if command_name == 'list':
-                    # Convert the arguments to Click's expected format
-                    formatted_args = []
-                    for arg in command_args:
-                        if arg.startswith('--'):
-                            # Split option and value if combined
-                            if '=' in arg:
-                                opt, val = arg.split('=', 1)
-                                formatted_args.extend([opt, val.strip('"')])
-                            else:
-                                formatted_args.append(arg)
-                        else:
-                            formatted_args.append(arg.strip('"'))
-                    command_args = formatted_args
-                
-                return cli.commands[command_name].main(args=command_args, standalone_mode=False)
+    command_names = cli.command_names()
+    ctx = click.get_current_context()
+    command_args = [*args]
+    
+    alias_error = _ALIAS_ERRORS.get(command_or_alias)
+    if alias_error:
+        raise click.UsageError(alias_error)
+    
+    target = _ALIAS_TARGETS.get(command_or_alias)
+    if target:
+        command_name, command, fixed_args, placeholders = target
+        if placeholders:
+            # Fill {0}, {1}, ..., {issue} and {query} from the alias arguments
+            parts = [*fixed_args]
+            values = {str(i): arg for i, arg in enumerate(args)}
+            if args:
+                values['issue'] = values['query'] = args[0]
+            try:
+                for i, template in placeholders.items():
+                    parts[i] = ''.join(
+                        literal if field is None else literal + values[field]
+                        for literal, field in template
+                    )
+            except KeyError:
+                raise click.UsageError(f"Not enough arguments for alias '{command_or_alias}'")
+            command_args = parts
         else:
-            raise click.UsageError(f"Unknown command: {command_name}")
+            if command_name == 'list':
+                command_args = _normalize_list_args(command_args)
+            # Add any additional args passed to the command
+            command_args = fixed_args + command_args
     else:
         # If not an alias, treat as a regular command
-        if command_or_alias in cli.commands:
-            ctx = click.get_current_context()
-            with ctx.scope(cleanup=False):
-                return cli.commands[command_or_alias].main(args=args, standalone_mode=False)
-        else:
-            raise click.UsageError(f"Unknown command: {command_or_alias}")
+        command_name = command_or_alias
+        command = cli.commands[command_name] if command_name in command_names else None
+    
+    if command is None:
+        raise click.UsageError(f"Unknown command: {command_name}")
+    
+    # Run the command within the current context
+    with ctx.scope(cleanup=False):
+        return command.main(args=command_args, standalone_mode=False)
+
+def _alias_dispatch(alias_name: str, args: Tuple[str, ...]) -> None:
+    """Run an alias with the arguments its command was invoked with"""
+    ctx = click.get_current_context()
+    return ctx.invoke(run, command_or_alias=alias_name, args=args)
 
 def create_alias_command(alias_name: str) -> None:
-    """Create a command function for an alias"""
-    @cli.command(name=alias_name)
-    @click.argument('args', nargs=-1)
-    def alias_command(args: Tuple[str, ...]) -> None:
-        """Alias command"""
-        ctx = click.get_current_context()
-        return ctx.invoke(run, command_or_alias=alias_name, args=args)
-    return None
-
-# Register all aliases as commands
-config = load_config()
-aliases = config.get('aliases', {})
-for alias_name in aliases:
-    create_alias_command(alias_name)
+    """Register an alias as a command"""
+    # The alias name is bound to the callback rather than read from the
+    # context: an alias that targets another alias is run through main(),
+    # which names the context after the program instead of the alias
+    cli.add_command(click.Command(
+        name=alias_name,
+        params=[click.Argument(['args'], nargs=-1)],
+        callback=functools.partial(_alias_dispatch, alias_name),
+        help='Alias command'
+    ))
 
 # Issue viewing and management commands
 @cli.command()
 @click.argument('issue_key')
 @click.option('--format', '-f', type=click.Choice(['table', 'json', 'markdown']), default='table', help='Output format')
+@_handle_jira_errors
 def view(issue_key: str, format: str) -> None:
     """View a specific issue"""
-    try:
-        client = JiraClient()
-        issue = client.get_issue(issue_key)
-        formatter = IssueFormatter()
-        
-        if format == 'table':
-            console.print(formatter.format_issue(issue))
-        elif format == 'json':
-            # Convert issue to JSON
-            issue_dict = {
-                'key': issue.key,
-                'summary': issue.fields.summary,
-                'status': issue.fields.status.name,
-                'assignee': getattr(issue.fields.assignee, 'displayName', 'Unassigned'),
-                'created': issue.fields.created,
-                'updated': issue.fields.updated,
-                'description': issue.fields.description
-            }
-            console.print(json.dumps(issue_dict, indent=2))
-        else:  # markdown
-            console.print(formatter.format_issue_markdown(issue))
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from .client import JiraClient
+    client = JiraClient()
+    issue = client.get_issue(issue_key)
+    formatter = _formatter()
+    
+    if format == 'table':
+        _console().print(formatter.format_issue(issue))
+    elif format == 'json':
+        # Convert issue to JSON
+        issue_dict = {
+            'key': issue.key,
+            'summary': issue.fields.summary,
+            'status': issue.fields.status.name,
+            'assignee': getattr(issue.fields.assignee, 'displayName', 'Unassigned'),
+            'created': issue.fields.created,
+            'updated': issue.fields.updated,
+            'description': issue.fields.description
+        }
+        # Echoed directly: Rich would treat brackets in the text as markup
+        click.echo(_dumps_json(issue_dict))
+    else:  # markdown
+        # The markdown is plain text: brackets in the issue or the truncation
+        # marker are not Rich markup
+        _console().print(formatter.format_issue_markdown(issue), markup=False)
 
 # Bulk operations
 @cli.command()
@@ -155,96 +329,108 @@ def view(issue_key: str, format: str) -> None:
 @click.option('--assignee', help='New assignee')
 @click.option('--add-labels', help='Labels to add (comma-separated)')
 @click.option('--yes', '-y', is_flag=True, help='Skip confirmation')
-@click.option('--batch-size', default=50, help='Number of issues to process at once')
+@click.option('--batch-size', default=50, type=click.IntRange(min=1), help='Number of issues to process at once')
+@click.option('--concurrency', default=4, type=click.IntRange(min=1), help='Number of batches to update in parallel')
 @click.option('--project', help='Filter by project key')
-def bulk_update(query: str, status: Optional[str], assignee: Optional[str], add_labels: Optional[str], yes: bool, batch_size: int, project: Optional[str] = None) -> None:
+@_handle_jira_errors
+def bulk_update(query: str, status: Optional[str], assignee: Optional[str], add_labels: Optional[str], yes: bool, batch_size: int, concurrency: int, project: Optional[str] = None) -> None:
     """Bulk update issues matching JQL query"""
-    try:
-        client = JiraClient()
-        
-        # Add project filter if specified or use default
-        project_to_use = project or os.getenv('JIRA_DEFAULT_PROJECT')
-        if project_to_use:
-            query = f"project = {project_to_use} AND ({query})" if query else f"project = {project_to_use}"
-        
-        issues = client.search_issues(query)
-        total = len(issues)
-        
-        if not yes:
-            if not Confirm.ask(f"Are you sure you want to update {total} issues?"):
-                click.echo("Operation cancelled")
-                return
-        
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Updating issues...", total=total)
-            updated = 0
-            batch = []
-            
-            for issue in issues:
-                batch.append(issue)
-                if len(batch) >= batch_size:
-                    client.bulk_update_batch(batch, status, assignee, add_labels)
-                    updated += len(batch)
-                    progress.update(task, advance=len(batch))
-                    batch = []
-            
-            # Process remaining issues
-            if batch:
-                client.bulk_update_batch(batch, status, assignee, add_labels)
-                updated += len(batch)
-                progress.update(task, advance=len(batch))
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from rich.progress import Progress
+    from rich.prompt import Confirm
+
+    from .client import JiraClient
+    client = JiraClient()
+    
+    # Add project filter if specified or use default
+    project_to_use = project or _default_project()
+    conditions = []
+    if project_to_use:
+        conditions.append(f"project = {project_to_use}")
+    if query:
+        conditions.append(f"({query})")
+    query = " AND ".join(conditions)
+    
+    # Count first so nothing is downloaded if the user cancels
+    total = client.count_issues(query)
+    
+    if not yes:
+        if not Confirm.ask(f"Are you sure you want to update {total} issues?"):
+            click.echo("Operation cancelled")
+            return
+    
+    # Collect the matches before updating: paging while updating would skip
+    # issues that stop matching the query. Labels are merged into updates and
+    # project, type and status let transition lookups be shared across issues.
+    issues = [*client.iter_issues(query, page_size=batch_size,
+                                  fields=['labels', 'project', 'issuetype', 'status'])]
+    
+    batches = [issues[i:i + batch_size] for i in range(0, len(issues), batch_size)]
+    
+    with Progress() as progress, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        task = progress.add_task("[cyan]Updating issues...", total=len(issues))
+        futures = {
+            executor.submit(client.bulk_update_batch, batch, status, assignee, add_labels): batch
+            for batch in batches
+        }
         
-        console.print(f"[green]Successfully updated {updated} issues[/green]")
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+        # Failed issues are reported at the end; the other issues and batches still run
+        failed: Dict[str, str] = {}
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                failed.update(future.result())
+            except JiraCliError as e:
+                # The batch failed as a whole
+                failed.update((issue.key, str(e)) for issue in batch)
+            progress.update(task, advance=len(batch))
+    
+    _console().print(f"[green]Successfully updated {len(issues) - len(failed)} issues[/green]")
+    if failed:
+        raise JiraApiError(
+            f"Failed to update {len(failed)} of {len(issues)} issues:\n"
+            + '\n'.join(f"{key}: {error}" for key, error in failed.items()))
 
 # Issue relationship management
 @cli.command()
 @click.argument('issue_key')
 @click.option('--watch/--unwatch', default=True, help='Add or remove watcher')
+@_handle_jira_errors
 def watch(issue_key: str, watch: bool) -> None:
     """Add or remove yourself as a watcher"""
-    try:
-        client = JiraClient()
-        if watch:
-            client.add_watcher(issue_key)
-            click.echo(f"Added watcher to {issue_key}")
-        else:
-            client.remove_watcher(issue_key)
-            click.echo(f"Removed watcher from {issue_key}")
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from .client import JiraClient
+    client = JiraClient()
+    if watch:
+        client.add_watcher(issue_key)
+        click.echo(f"Added watcher to {issue_key}")
+    else:
+        client.remove_watcher(issue_key)
+        click.echo(f"Removed watcher from {issue_key}")
 
 # Board and sprint management commands
 @cli.command()
 @click.argument('board_id')
 @click.option('--days', default=14, help='Number of days to analyze')
+@_handle_jira_errors
 def velocity(board_id: str, days: int) -> None:
     """Show velocity metrics for a board"""
-    try:
-        client = JiraClient()
-        metrics = client.get_velocity_metrics(board_id, days)
-        
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Sprint")
-        table.add_column("Completed Points")
-        table.add_column("Completed Issues")
-        table.add_column("Average Points/Issue")
-        
-        for sprint in metrics:
-            table.add_row(
-                sprint['name'],
-                str(sprint['completed_points']),
-                str(sprint['completed_issues']),
-                f"{sprint['average_points']:.1f}"
-            )
-        
-        console.print(table)
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from .client import JiraClient
+    client = JiraClient()
+    metrics = client.get_velocity_metrics(board_id, days)
+    
+    rows = [
+        (
+            sprint['name'],
+            str(sprint['completed_points']),
+            str(sprint['completed_issues']),
+            f"{sprint['average_points']:.1f}"
+        )
+        for sprint in metrics
+    ]
+    table = _make_table(["Sprint", "Completed Points", "Completed Issues", "Average Points/Issue"], rows)
+    
+    _console().print(table)
 
 # Sprint subcommands group
 @cli.group(invoke_without_command=True)
@@ -257,8 +443,10 @@ def sprint(ctx: Context) -> None:
 @sprint.command(name='list')
 @click.option('--board', required=True, help='Board ID')
 @click.option('--state', help='Sprint state (active/future/closed)')
+@_handle_jira_errors
 def list_sprints(board: str, state: Optional[str]) -> None:
     """List sprints for a board"""
+    from .client import JiraClient
     client = JiraClient()
     sprints = client.get_sprints(board, state)
     for sprint in sprints:
@@ -267,8 +455,10 @@ def list_sprints(board: str, state: Optional[str]) -> None:
 @sprint.command(name='add')
 @click.argument('sprint_id')
 @click.argument('issue_keys', nargs=-1)
+@_handle_jira_errors
 def add_to_sprint(sprint_id: str, issue_keys: Tuple[str, ...]) -> None:
     """Add issues to a sprint"""
+    from .client import JiraClient
     client = JiraClient()
     client.add_to_sprint(sprint_id, issue_keys)
     click.echo(f"Added {len(issue_keys)} issues to sprint {sprint_id}")
@@ -277,8 +467,10 @@ def add_to_sprint(sprint_id: str, issue_keys: Tuple[str, ...]) -> None:
 @click.option('--board', required=True, help='Board ID')
 @click.option('--name', required=True, help='Sprint name')
 @click.option('--start-date', help='Start date (YYYY-MM-DD)')
+@_handle_jira_errors
 def create_sprint(board: str, name: str, start_date: Optional[str]) -> None:
     """Create a new sprint"""
+    from .client import JiraClient
     client = JiraClient()
     sprint = client.create_sprint(board, name, start_date)
     click.echo(f"Created sprint: {sprint.id}")
@@ -288,42 +480,43 @@ def create_sprint(board: str, name: str, start_date: Optional[str]) -> None:
 @click.option('--issue', help='Issue key to get field values from')
 @click.option('--custom-only', is_flag=True, help='Show only custom fields')
 @click.option('--with-values', is_flag=True, help='Show field values (requires --issue)')
-def fields(issue: Optional[str], custom_only: bool, with_values: bool) -> None:
+@click.option('--sort/--no-sort', default=True, help='Sort fields by name')
+@_handle_jira_errors
+def fields(issue: Optional[str], custom_only: bool, with_values: bool, sort: bool) -> None:
     """List all available fields and their IDs"""
-    try:
-        client = JiraClient()
-        field_map = client.get_field_map(issue if with_values else None)
-        
-        # Create table
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Name")
-        table.add_column("ID")
-        table.add_column("Type")
-        if with_values:
-            table.add_column("Value")
-        
-        # Sort fields by name
-        sorted_fields = sorted(field_map.items())
-        
-        for name, info in sorted_fields:
-            # Skip non-custom fields if custom-only flag is set
-            if custom_only and not info['custom']:
-                continue
-                
-            row = [
-                name,
-                info['id'],
-                info['type']
-            ]
-            if with_values:
-                row.append(info.get('value', ''))
-            
-            table.add_row(*row)
-        
-        console.print(table)
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from rich.table import Column
+
+    from .client import JiraClient
+    client = JiraClient()
+    field_map = client.get_field_map(issue if with_values else None)
+    
+    # Sort fields by name unless the server order is wanted, skipping
+    # non-custom fields if the custom-only flag is set
+    sorted_fields = [
+        (name, info)
+        for name, info in (sorted(field_map.items(), key=itemgetter(0)) if sort else field_map.items())
+        if not custom_only or info['custom']
+    ]
+    
+    rows: List[Tuple[str, ...]]
+    if with_values:
+        rows = [
+            (name, info['id'], info['type'], '' if info.get('value') is None else str(info['value']))
+            for name, info in sorted_fields
+        ]
+    else:
+        rows = [(name, info['id'], info['type']) for name, info in sorted_fields]
+    
+    if _plain_output():
+        _echo_rows(rows)
+        return
+    
+    columns: List[Union[str, Column]] = ["Name", Column("ID", no_wrap=True), "Type"]
+    if with_values:
+        columns.append("Value")
+    table = _make_table(columns, rows)
+    
+    _console().print(table)
 
 # Issue update and modification commands
 @cli.command()
@@ -333,38 +526,40 @@ def fields(issue: Optional[str], custom_only: bool, with_values: bool) -> None:
 @click.option('--priority', help='Priority level')
 @click.option('--labels', help='Comma-separated labels')
 @click.option('--yes', '-y', is_flag=True, help='Skip confirmation')
+@_handle_jira_errors
 def update(issue_key: str, status: Optional[str], assignee: Optional[str], 
           priority: Optional[str], labels: Optional[str], yes: bool) -> None:
     """Update an issue"""
-    try:
-        if not yes:
-            if not Confirm.ask(f"Are you sure you want to update {issue_key}?"):
-                click.echo("Operation cancelled")
-                return
-                
-        client = JiraClient()
-        fields = {}
-        
-        if status:
-            fields['status'] = status
-        if assignee:
-            fields['assignee'] = assignee
-        if priority:
-            fields['priority'] = priority
-        if labels:
-            fields['labels'] = labels.split(',')
-        
-        client.update_issue(issue_key, fields)
-        click.echo(f"Updated issue: {issue_key}")
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from rich.prompt import Confirm
+
+    from .client import JiraClient
+    if not yes:
+        if not Confirm.ask(f"Are you sure you want to update {issue_key}?"):
+            click.echo("Operation cancelled")
+            return
+            
+    client = JiraClient()
+    fields = {}
+    
+    if status:
+        fields['status'] = status
+    if assignee:
+        fields['assignee'] = assignee
+    if priority:
+        fields['priority'] = priority
+    if labels:
+        fields['labels'] = labels.split(',')
+    
+    client.update_issue(issue_key, fields)
+    click.echo(f"Updated issue: {issue_key}")
 
 @cli.command()
 @click.argument('issue_key')
 @click.argument('comment_text')
+@_handle_jira_errors
 def comment(issue_key: str, comment_text: str) -> None:
     """Add a comment to an issue"""
+    from .client import JiraClient
     client = JiraClient()
     client.add_comment(issue_key, comment_text)
     click.echo(f"Added comment to {issue_key}")
@@ -373,8 +568,10 @@ def comment(issue_key: str, comment_text: str) -> None:
 @cli.command()
 @click.argument('query')
 @click.option('--output', help='Output CSV file path')
+@_handle_jira_errors
 def export(query: str, output: Optional[str]) -> None:
     """Export issues to CSV"""
+    from .client import JiraClient
     client = JiraClient()
     client.export_issues(query, output)
     click.echo(f"Exported issues to {output}")
@@ -382,50 +579,58 @@ def export(query: str, output: Optional[str]) -> None:
 @cli.command()
 @click.argument('issue_key')
 @click.argument('files', nargs=-1, type=click.Path(exists=True))
+@_handle_jira_errors
 def attach(issue_key: str, files: Tuple[str, ...]) -> None:
     """Attach files to an issue"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from .client import JiraClient
+    if not files:
+        return
     client = JiraClient()
-    for file in files:
-        client.add_attachment(issue_key, file)
-        click.echo(f"Attached {file} to {issue_key}")
+    # Uploads are independent HTTP requests, so run them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        futures = {executor.submit(client.add_attachment, issue_key, file): file for file in files}
+        # Every upload is reported, so a failure does not hide which files went up
+        failed: Dict[str, str] = {}
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                future.result()
+            except JiraCliError as e:
+                failed[file] = str(e)
+            else:
+                click.echo(f"Attached {file} to {issue_key}")
+    if failed:
+        raise JiraApiError(
+            f"Failed to attach {len(failed)} of {len(files)} files:\n"
+            + '\n'.join(f"{file}: {error}" for file, error in failed.items()))
 
 # Time tracking and work logging
 @cli.command()
 @click.argument('issue_key')
 @click.option('--time', required=True, help='Time spent (e.g., "3h 30m")')
 @click.option('--comment', help='Work log comment')
+@_handle_jira_errors
 def log(issue_key: str, time: str, comment: Optional[str] = None) -> None:
     """Log work on an issue"""
-    try:
-        # Validate time format
-        if not any(unit in time for unit in ['w', 'd', 'h', 'm']):
-            raise click.UsageError('Time must include units (w=weeks, d=days, h=hours, m=minutes)')
-            
-        client = JiraClient()
-        client.log_work(issue_key, time, comment)
-        click.echo(f"Logged {time} on {issue_key}")
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from .client import JiraClient
+
+    # Validate time format
+    if _TIME_UNITS.isdisjoint(time):
+        raise click.UsageError('Time must include units (w=weeks, d=days, h=hours, m=minutes)')
+        
+    client = JiraClient()
+    client.log_work(issue_key, time, comment)
+    click.echo(f"Logged {time} on {issue_key}")
 
 # Issue listing and searching
-@cli.command()
-@click.option('--query', default='', help='JQL query string')
-@click.option('--status', default=None, help='Filter by status')
-@click.option('--assignee', default=None, help='Filter by assignee (use "currentUser()" for yourself)')
-@click.option('--project', default=None, help='Filter by project key')
-@click.option('--type', default=None, help='Filter by issue type')
-@click.option('--priority', default=None, help='Filter by priority')
-@click.option('--reporter', default=None, help='Filter by reporter')
-@click.option('--component', default=None, help='Filter by component')
-@click.option('--labels', default=None, help='Filter by labels (comma-separated)')
-@click.option('--created-after', default=None, help='Filter by creation date (YYYY-MM-DD)')
-@click.option('--updated-after', default=None, help='Filter by update date (YYYY-MM-DD)')
-def list(query: str = '', status: Optional[str] = None, assignee: Optional[str] = None, 
-        project: Optional[str] = None, type: Optional[str] = None, priority: Optional[str] = None,
-        reporter: Optional[str] = None, component: Optional[str] = None, labels: Optional[str] = None,
-        created_after: Optional[str] = None, updated_after: Optional[str] = None) -> None:
-    """List issues using JQL. If no JQL provided, uses filters or shows all assigned issues."""
+def _do_list(query: str = '', status: Optional[str] = None, assignee: Optional[str] = None,
+             project: Optional[str] = None, type: Optional[str] = None, priority: Optional[str] = None,
+             reporter: Optional[str] = None, component: Optional[str] = None, labels: Optional[str] = None,
+             created_after: Optional[str] = None, updated_after: Optional[str] = None) -> None:
+    """Build the JQL for the given filters, search and print the matching issues"""
+    from .client import JiraClient
     try:
         client = JiraClient()
         
@@ -433,7 +638,7 @@ def list(query: str = '', status: Optional[str] = None, assignee: Optional[str]
         conditions = []
         
         # Use project from command line or default from environment
-        project_to_use = project or os.getenv('JIRA_DEFAULT_PROJECT')
+        project_to_use = project or _default_project()
         if project_to_use:
             conditions.append(f"project = {project_to_use}")
             
@@ -466,22 +671,47 @@ def list(query: str = '', status: Optional[str] = None, assignee: Optional[str]
         
         jql = " AND ".join(conditions)
         
-        issues = client.search_issues(jql)
+        issues = client.search_issues(jql, fields=_LIST_FIELDS)
         if not issues:
-            console.print("[yellow]No issues found matching the criteria[/yellow]")
-            exit(1)
-        
-        formatter = IssueFormatter()
-        table = formatter.format_issue_list(issues)
-        console.print(table)
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+            _console().print("[yellow]No issues found matching the criteria[/yellow]")
+            sys.exit(1)
+        
+        formatter = _formatter()
+        if _plain_output():
+            _echo_rows(formatter.issue_list_rows(issues))
+            return
+        console = _console()
+        console.print(formatter.format_issue_list(issues, width=console.width))
+    except JiraCliError:
+        # Reported by _handle_jira_errors on the calling command
+        raise
     except Exception as e:
-        console.print(f"[red]An unexpected error occurred: {str(e)}[/red]")
+        _console().print(f"[red]An unexpected error occurred: {str(e)}[/red]")
         if os.getenv('PY_JIRA_DEBUG'):
             raise
-        exit(1)
+        sys.exit(1)
+
+@cli.command()
+@click.option('--query', default='', help='JQL query string')
+@click.option('--status', default=None, help='Filter by status')
+@click.option('--assignee', default=None, help='Filter by assignee (use "currentUser()" for yourself)')
+@click.option('--project', default=None, help='Filter by project key')
+@click.option('--type', default=None, help='Filter by issue type')
+@click.option('--priority', default=None, help='Filter by priority')
+@click.option('--reporter', default=None, help='Filter by reporter')
+@click.option('--component', default=None, help='Filter by component')
+@click.option('--labels', default=None, help='Filter by labels (comma-separated)')
+@click.option('--created-after', default=None, help='Filter by creation date (YYYY-MM-DD)')
+@click.option('--updated-after', default=None, help='Filter by update date (YYYY-MM-DD)')
+@_handle_jira_errors
+def list(query: str = '', status: Optional[str] = None, assignee: Optional[str] = None, 
+        project: Optional[str] = None, type: Optional[str] = None, priority: Optional[str] = None,
+        reporter: Optional[str] = None, component: Optional[str] = None, labels: Optional[str] = None,
+        created_after: Optional[str] = None, updated_after: Optional[str] = None) -> None:
+    """List issues using JQL. If no JQL provided, uses filters or shows all assigned issues."""
+    _do_list(query=query, status=status, assignee=assignee, project=project, type=type,
+             priority=priority, reporter=reporter, component=component, labels=labels,
+             created_after=created_after, updated_after=updated_after)
 
 # Issue creation and workflow commands
 @cli.command()
@@ -492,82 +722,78 @@ def list(query: str = '', status: Optional[str] = None, assignee: Optional[str]
 @click.option('--labels', help='Comma-separated labels')
 @click.option('--template', help='Template name to use')
 @click.option('--custom-field', multiple=True, help='Custom field in format "field=value"')
+@_handle_jira_errors
 def create(project: Optional[str], summary: str, description: Optional[str], priority: Optional[str], 
           labels: Optional[str], template: Optional[str], custom_field: Tuple[str, ...]) -> None:
     """Create a new issue"""
-    try:
-        client = JiraClient()
-        
-        # Use project from command line or default from environment
+    from .client import JiraClient
+    client = JiraClient()
+    
+    # Use project from command line or default from environment
+    if not project:
+        project = _default_project()
         if not project:
-            project = os.getenv('JIRA_DEFAULT_PROJECT')
-            if not project:
-                raise click.UsageError("Project is required. Specify with --project or set JIRA_DEFAULT_PROJECT")
-        
-        fields = {
-            'project': project,
-            'summary': summary,
-            'description': description
-        }
-        
-        # Use default issue type if not specified in template
-        if 'issuetype' not in fields and os.getenv('JIRA_DEFAULT_ISSUE_TYPE'):
-            fields['issuetype'] = {'name': os.getenv('JIRA_DEFAULT_ISSUE_TYPE')}
-        
-        if priority:
-            fields['priority'] = {'name': priority}
-        if labels:
-            fields['labels'] = labels.split(',')
-        
-        if template:
-            template_fields = load_config(f'templates/{template}.yaml')
-            fields.update(template_fields)
-        
-        for field in custom_field:
-            key, value = field.split('=')
-            fields[key] = value
-        
-        issue = client.create_issue(fields)
-        click.echo(f"Created issue: {issue.key}")
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+            raise click.UsageError("Project is required. Specify with --project or set JIRA_DEFAULT_PROJECT")
+    
+    fields = {
+        'project': project,
+        'summary': summary,
+        'description': description
+    }
+    
+    # Use default issue type if not specified in template
+    if 'issuetype' not in fields and os.getenv('JIRA_DEFAULT_ISSUE_TYPE'):
+        fields['issuetype'] = {'name': os.getenv('JIRA_DEFAULT_ISSUE_TYPE')}
+    
+    if priority:
+        fields['priority'] = {'name': priority}
+    if labels:
+        fields['labels'] = labels.split(',')
+    
+    if template:
+        from .config import get_template
+        template_fields = get_template(template)
+        if template_fields is None:
+            raise click.UsageError(f"Template '{template}' not found in ~/.jira/templates")
+        fields.update(template_fields)
+    
+    for field in custom_field:
+        key, value = field.split('=')
+        fields[key] = value
+    
+    issue = client.create_issue(fields)
+    click.echo(f"Created issue: {issue.key}")
 
 @cli.command()
 @click.argument('issue_key')
+@_handle_jira_errors
 def transitions(issue_key: str) -> None:
     """List available transitions for an issue"""
-    try:
-        client = JiraClient()
-        transitions = client.get_transitions(issue_key)
-        
-        # Create table for transitions
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("To Status", style="yellow")
-        
-        # Sort transitions by name for better readability
-        sorted_transitions = sorted(transitions, key=lambda x: x['name'])
-        
-        for t in sorted_transitions:
-            table.add_row(
-                str(t['id']),
-                t['name'],
-                t['to']['name']
-            )
-        
-        console.print(table)
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from rich.table import Column
+
+    from .client import JiraClient
+    client = JiraClient()
+    transitions = client.get_transitions(issue_key)
+    
+    # Sort transitions by name for better readability
+    rows = [(str(t['id']), t['name'], t['to']['name']) for t in sorted(transitions, key=itemgetter('name'))]
+    
+    # Create table for transitions
+    table = _make_table(
+        [Column("ID", style="cyan"), Column("Name", style="green"), Column("To Status", style="yellow")],
+        rows
+    )
+    
+    _console().print(table)
 
 @cli.command()
 @click.argument('issue_key')
 @click.argument('transition_name')
 @click.option('--resolution', help='Resolution when transitioning to Done')
+@_handle_jira_errors
 def transition(issue_key: str, transition_name: str, resolution: Optional[str]) -> None:
     """Transition an issue to a new status"""
+    from .client import JiraClient
     client = JiraClient()
     client.transition_issue(issue_key, transition_name, resolution)
     click.echo(f"Transitioned {issue_key} to {transition_name}")
@@ -577,31 +803,25 @@ def transition(issue_key: str, transition_name: str, resolution: Optional[str])
 @click.argument('issue_key')
 @click.option('--link-type', required=True, help='Type of link (e.g., "blocks", "relates to")')
 @click.argument('target_issue')
+@_handle_jira_errors
 def link(issue_key: str, link_type: str, target_issue: str) -> None:
     """Link two issues together"""
-    try:
-        # Validate both issues exist before linking
-        client = JiraClient()
-        # Check source issue
-        client.get_issue(issue_key)
-        # Check target issue
-        client.get_issue(target_issue)
-        # Create link
-        client.create_link(issue_key, target_issue, link_type)
-        click.echo(f"Created {link_type} link between {issue_key} and {target_issue}")
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
+    from .client import JiraClient
+
+    # Validate both issues exist before linking
+    client = JiraClient()
+    # Check source issue
+    client.get_issue(issue_key)
+    # Check target issue
+    client.get_issue(target_issue)
+    # Create link
+    client.create_link(issue_key, target_issue, link_type)
+    click.echo(f"Created {link_type} link between {issue_key} and {target_issue}")
 
 # Add this with the other CLI commands
 @cli.command()
 @click.option('--status', help='Filter by status')
+@_handle_jira_errors
 def my(status: Optional[str] = None) -> None:
     """Show issues assigned to you"""
-    try:
-        # Reuse list command logic with currentUser() assignee
-        ctx = click.get_current_context()
-        return ctx.invoke(list, assignee='currentUser()', status=status)
-    except JiraCliError as e:
-        console.print(f"[red]{str(e)}[/red]")
-        exit(1)
\ No newline at end of file
+    _do_list(assignee='currentUser()', status=status)
\ No newline at end of file
@@ -16,13 +16,152 @@ and convenience methods for common operations.
 
 import os
 import csv
+import functools
+import hashlib
+import json
+import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union, BinaryIO
-from jira import JIRA, Issue
-from dotenv import load_dotenv
-from .config import load_config
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, FrozenSet, Iterator, List, Optional, Tuple, TypeVar, Union, BinaryIO, TYPE_CHECKING
+from .config import jira_dir
 from .exceptions import ConfigurationError, JiraApiError, AuthenticationError, ValidationError
-from jira.resources import Resource
+
+if TYPE_CHECKING:
+    # The jira SDK is slow to import; it is loaded when a client is created
+    from jira import JIRA, Issue
+    from jira.client import ResultList
+    from jira.resources import Resource
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Connections per pool; enough for the bulk update and pagination thread pools
+_POOL_SIZE = 20
+
+# Default seconds to wait for Jira to connect or respond, per request
+_REQUEST_TIMEOUT = 30.0
+
+# Seconds to reuse the field definitions fetched by a client
+_FIELDS_CACHE_TTL = 600
+
+# Authenticated connections keyed by (server, email, token), shared by every
+# JiraClient in the process so they reuse one warm HTTP connection pool
+_connections: Dict[Tuple[str, str, str], 'JIRA'] = {}
+
+def _connect(server: str, email: str, token: str) -> 'JIRA':
+    """Get the shared Jira connection for a server and credentials, creating it on first use"""
+    key = (server, email, token)
+    connection = _connections.get(key)
+    if connection is None:
+        from jira import JIRA
+        from requests.adapters import HTTPAdapter
+        connection = JIRA(server=server, basic_auth=(email, token), timeout=_request_timeout())
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        connection._session.mount('https://', adapter)
+        connection._session.mount('http://', adapter)
+        connection = _connections.setdefault(key, connection)
+    return connection
+
+# Environment variables read by JiraClient
+_REQUIRED_VARS = ('JIRA_SERVER', 'JIRA_EMAIL', 'JIRA_API_TOKEN')
+_OPTIONAL_VARS = ('JIRA_DEFAULT_PROJECT', 'JIRA_DEFAULT_ISSUE_TYPE')
+
+@functools.lru_cache(maxsize=1)
+def _environment() -> Dict[str, str]:
+    """Load .env and read the Jira settings from the environment, once per process"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    env = os.environ
+    missing = [var for var in _REQUIRED_VARS if not env.get(var)]
+    if missing:
+        raise ConfigurationError(
+            f"Missing required environment variable{'s' if len(missing) > 1 else ''}: {', '.join(missing)}")
+    return {var: env[var] for var in (*_REQUIRED_VARS, *_OPTIONAL_VARS) if env.get(var)}
+
+def _request_timeout() -> float:
+    """Seconds to wait on each Jira request, from JIRA_CLI_TIMEOUT (default 30)"""
+    try:
+        return float(os.getenv('JIRA_CLI_TIMEOUT', _REQUEST_TIMEOUT))
+    except ValueError:
+        return _REQUEST_TIMEOUT
+
+def _search_cache_ttl() -> float:
+    """Seconds to reuse search results for, from JIRA_CLI_CACHE_TTL (default 0, disabled)"""
+    try:
+        return float(os.getenv('JIRA_CLI_CACHE_TTL', '0'))
+    except ValueError:
+        return 0.0
+
+def _search_cache_dir() -> Path:
+    """Directory holding cached search results"""
+    return jira_dir() / '.cache'
+
+def _read_search_cache(key: str) -> Optional[List[Dict[str, Any]]]:
+    """Get the raw issues cached for a search key, or None if missing or expired"""
+    ttl = _search_cache_ttl()
+    if ttl <= 0:
+        return None
+    path = _search_cache_dir() / f'{key}.json'
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            path.unlink(missing_ok=True)
+            return None
+        with open(path) as f:
+            raw_issues: List[Dict[str, Any]] = json.load(f)
+        return raw_issues
+    except (OSError, ValueError):
+        return None
+
+def _write_search_cache(key: str, raw_issues: List[Dict[str, Any]]) -> None:
+    """Cache raw issues for a search key; failures only cost a future cache miss"""
+    ttl = _search_cache_ttl()
+    if ttl <= 0:
+        return
+    cache_dir = _search_cache_dir()
+    path = cache_dir / f'{key}.json'
+    tmp_path = cache_dir / f'{key}.{os.getpid()}.tmp'
+    try:
+        # Issue data can be private, so only the user may read the cache
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _prune_search_cache(ttl)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(raw_issues, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+def _prune_search_cache(ttl: float) -> None:
+    """Delete cached results (and leftover temporary files) older than ttl seconds"""
+    cutoff = time.time() - ttl
+    for path in _search_cache_dir().iterdir():
+        try:
+            if path.suffix in ('.json', '.tmp') and path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+def _clear_search_cache() -> None:
+    """Drop all cached search results, after a change that may affect them"""
+    try:
+        for path in _search_cache_dir().glob('*.json'):
+            path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+def _split_labels(labels: Optional[str]) -> List[str]:
+    """Split a comma-separated label list, dropping surrounding whitespace and empty labels"""
+    return [label for label in (part.strip() for part in (labels or '').split(',')) if label]
+
+def _field_value(value: Any) -> Any:
+    """Reduce a raw issue field value to a displayable value"""
+    if isinstance(value, dict):
+        # Option values, then named resources such as priorities and users
+        for key in ('value', 'name', 'displayName'):
+            if key in value:
+                return value[key]
+    return str(value)
 
 class JiraClient:
     """
@@ -45,26 +184,32 @@ class JiraClient:
         """
         Initialize the Jira client.
 
-        Loads configuration from environment and establishes connection to Jira.
+        Loads configuration from environment and connects to Jira. Clients with
+        the same server and credentials share one connection.
         
         Raises:
             AuthenticationError: If authentication fails
             ConfigurationError: If required environment variables are missing
         """
-        load_dotenv()
         self.config: Dict[str, str] = self._load_environment()
         try:
-            self.client: JIRA = JIRA(
-                server=self.config['JIRA_SERVER'],
-                basic_auth=(self.config['JIRA_EMAIL'], self.config['JIRA_API_TOKEN'])
-            )
+            self.client: 'JIRA' = _connect(
+                self.config['JIRA_SERVER'], self.config['JIRA_EMAIL'], self.config['JIRA_API_TOKEN'])
         except Exception as e:
             raise AuthenticationError(f"Failed to authenticate with Jira: {str(e)}")
+        # Transition IDs by name and screen fields by transition ID, keyed by
+        # (project, issue type, status); see _transitions_for
+        self._transitions_cache: Dict[Tuple[str, str, str], Tuple[Dict[str, str], Dict[str, FrozenSet[str]]]] = {}
+        # Field definitions and the time.monotonic() they were fetched at; see _field_definitions
+        self._fields_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
 
     def _load_environment(self) -> Dict[str, str]:
         """
         Load configuration from environment variables.
 
+        The .env file and environment are read once per process; later
+        clients reuse the same settings.
+
         Returns:
             Dict[str, str]: Dictionary containing configuration values
 
@@ -76,33 +221,10 @@ class JiraClient:
             >>> config = client._load_environment()
             >>> print(config['JIRA_SERVER'])
         """
-        required_vars: List[str] = [
-            'JIRA_SERVER', 
-            'JIRA_EMAIL', 
-            'JIRA_API_TOKEN'
-        ]
-        optional_vars: List[str] = [
-            'JIRA_DEFAULT_PROJECT',
-            'JIRA_DEFAULT_ISSUE_TYPE'
-        ]
-        config: Dict[str, str] = {}
-        
-        # Load required variables
-        for var in required_vars:
-            value = os.getenv(var)
-            if not value:
-                raise ConfigurationError(f"Missing required environment variable: {var}")
-            config[var] = value
-            
-        # Load optional variables
-        for var in optional_vars:
-            value = os.getenv(var)
-            if value:
-                config[var] = value
-            
-        return config
+        # Copy so callers cannot modify the cached settings
+        return dict(_environment())
 
-    def get_issue(self, issue_key: str) -> Issue:
+    def get_issue(self, issue_key: str) -> 'Issue':
         """
         Retrieve a specific issue from Jira.
 
@@ -124,49 +246,190 @@ class JiraClient:
         except Exception as e:
             raise JiraApiError(f"Failed to get issue {issue_key}: {str(e)}")
 
-    def search_issues(self, jql: str, max_results: int = 50) -> List[Issue]:
+    def search_issues(self, jql: str, max_results: Optional[int] = None,
+                      fields: Optional[List[str]] = None, max_workers: int = 10,
+                      page_size: int = 100) -> List['Issue']:
         """
         Search for issues using JQL (Jira Query Language).
 
+        The first page reports the total number of matches; the remaining
+        pages are then requested concurrently.
+
         Args:
             jql (str): JQL query string to search issues
-            max_results (int): Maximum number of results to return
+            max_results (Optional[int]): Maximum number of issues to return (default: all)
+            fields (Optional[List[str]]): Issue fields to fetch (default: all fields)
+            max_workers (int): Maximum number of pages requested at once; lower
+                it if the server rate-limits concurrent searches
+            page_size (int): Number of issues to request per page; the server
+                may return fewer
 
         Returns:
-            List[Issue]: List of matching Jira issues
+            List[Issue]: List of matching Jira issues, in search order
 
         Raises:
             JiraApiError: If the search request fails
 
         Example:
-            >>> issues = client.search_issues('project = DATA AND status = "In Progress"', max_results=50)
+            >>> issues = client.search_issues('project = DATA AND status = "In Progress"',
+            ...                               fields=['summary', 'status'])
             >>> for issue in issues:
             ...     print(f"{issue.key}: {issue.fields.summary}")
         """
+        # Repeated searches within JIRA_CLI_CACHE_TTL seconds reuse the last result
+        cache_key = hashlib.sha1(json.dumps(
+            [self.config['JIRA_SERVER'], self.config['JIRA_EMAIL'], jql, fields, max_results]).encode()).hexdigest()
+        cached = _read_search_cache(cache_key)
+        if cached is not None:
+            from jira.resources import Issue
+            return [Issue(self.client._options, self.client._session, raw=raw) for raw in cached]
+
+        if max_results is not None:
+            page_size = min(page_size, max_results)
+
+        def fetch_page(start_at: int) -> 'ResultList[Issue]':
+            return self.client.search_issues(
+                jql,
+                startAt=start_at,
+                maxResults=page_size,
+                fields=fields or '*all'
+            )
+
         try:
-            start_at = 0
-            all_issues = []
-            
-            while True:
-                results = self.client.search_issues(
-                    jql, 
-                    startAt=start_at, 
-                    maxResults=max_results
-                )
-                if not results:
-                    break
-                
-                all_issues.extend(results)
-                if len(results) < max_results:
-                    break
-                
-                start_at += max_results
-                
-            return all_issues
+            first_page = fetch_page(0)
+            total = first_page.total if max_results is None else min(first_page.total, max_results)
+            # The server may cap the page size below page_size
+            returned = len(first_page)
+            if not returned or returned >= total:
+                issues = list(first_page[:total])
+            else:
+                pages = self._run_concurrent(
+                    fetch_page, list(range(returned, total, returned)), max_workers)
+                issues = [issue for page in [first_page, *pages] for issue in page][:total]
+        except Exception as e:
+            raise JiraApiError(f"JQL search failed: {str(e)}")
+        
+        _write_search_cache(cache_key, [issue.raw for issue in issues])
+        return issues
+
+    def iter_issues(self, jql: str, page_size: int = 50,
+                    fields: Optional[List[str]] = None) -> Iterator['Issue']:
+        """
+        Iterate over issues matching a JQL query, fetching one page at a time.
+
+        Unlike search_issues, pages are requested lazily as the caller consumes
+        them, so only one page of issues is held in memory at once.
+
+        Args:
+            jql (str): JQL query string to search issues
+            page_size (int): Number of issues to request per page
+            fields (Optional[List[str]]): Issue fields to fetch (default: all fields)
+
+        Yields:
+            Issue: Matching Jira issues, in search order
+
+        Raises:
+            JiraApiError: If a page request fails
+
+        Example:
+            >>> for issue in client.iter_issues('project = DATA', page_size=100):
+            ...     print(issue.key)
+        """
+        return self._iter_search(jql, page_size, fields, json_result=False)
+
+    def iter_raw_issues(self, jql: str, page_size: int = 100,
+                        fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the raw JSON of issues matching a JQL query, one page at a time.
+
+        Like iter_issues, but the issues are left as the dicts returned by the
+        REST API instead of being wrapped in Issue resources, which is cheaper
+        for read-only callers that only need a few fields.
+
+        Args:
+            jql (str): JQL query string to search issues
+            page_size (int): Number of issues to request per page
+            fields (Optional[List[str]]): Issue fields to fetch (default: all fields)
+
+        Yields:
+            Dict[str, Any]: Raw issue JSON, with 'key' and a 'fields' dict keyed by field ID
+
+        Raises:
+            JiraApiError: If a page request fails
+
+        Example:
+            >>> for raw in client.iter_raw_issues('project = DATA', fields=['summary']):
+            ...     print(raw['key'], raw['fields']['summary'])
+        """
+        return self._iter_search(jql, page_size, fields, json_result=True)
+
+    def _iter_search(self, jql: str, page_size: int, fields: Optional[List[str]],
+                     json_result: bool) -> Iterator[Any]:
+        """Yield the issues matching a JQL query, requesting each page as the previous one is consumed"""
+        start_at = 0
+        while True:
+            issues: List[Any]
+            total: Optional[int]
+            try:
+                # Separate calls so each gets its own result type: the raw
+                # response dict, or a ResultList of Issue resources
+                if json_result:
+                    response: Dict[str, Any] = self.client.search_issues(
+                        jql,
+                        startAt=start_at,
+                        maxResults=page_size,
+                        fields=fields or '*all',
+                        json_result=True
+                    )
+                    issues, total = response['issues'], response.get('total')
+                else:
+                    page: 'ResultList[Issue]' = self.client.search_issues(
+                        jql,
+                        startAt=start_at,
+                        maxResults=page_size,
+                        fields=fields or '*all',
+                        json_result=False
+                    )
+                    issues, total = page, page.total
+            except Exception as e:
+                raise JiraApiError(f"JQL search failed: {str(e)}")
+
+            yield from issues
+            # The server may cap the page size below page_size, so advance by
+            # what was returned and stop at the reported total. Responses
+            # without a total end at the first short page.
+            start_at += len(issues)
+            if total is None:
+                done = len(issues) < page_size
+            else:
+                done = start_at >= total
+            if not issues or done:
+                break
+
+    def count_issues(self, jql: str) -> int:
+        """
+        Count the issues matching a JQL query without fetching them.
+
+        Args:
+            jql (str): JQL query string to count issues for
+
+        Returns:
+            int: Total number of matching issues
+
+        Raises:
+            JiraApiError: If the search request fails
+
+        Example:
+            >>> client.count_issues('project = DATA AND status = "To Do"')
+            42
+        """
+        try:
+            page: 'ResultList[Issue]' = self.client.search_issues(jql, maxResults=1, fields='key')
+            return page.total
         except Exception as e:
             raise JiraApiError(f"JQL search failed: {str(e)}")
 
-    def create_issue(self, fields: Dict[str, Any]) -> Issue:
+    def create_issue(self, fields: Dict[str, Any]) -> 'Issue':
         """
         Create a new Jira issue.
 
@@ -206,7 +469,9 @@ class JiraClient:
             if 'issuetype' not in fields and 'JIRA_DEFAULT_ISSUE_TYPE' in self.config:
                 fields['issuetype'] = self.config['JIRA_DEFAULT_ISSUE_TYPE']
                 
-            return self.client.create_issue(fields=fields)
+            issue = self.client.create_issue(fields=fields)
+            _clear_search_cache()
+            return issue
         except Exception as e:
             raise JiraApiError(f"Failed to create issue: {str(e)}")
 
@@ -231,8 +496,10 @@ class JiraClient:
             >>> client.update_issue('DATA-123', fields)
         """
         try:
-            issue = self.client.issue(issue_key)
-            issue.update(fields=fields)
+            # PUT the fields directly; fetching the issue first is an extra round trip
+            url = self.client._get_url(f'issue/{issue_key}')
+            self.client._session.put(url, data=json.dumps({'fields': fields}))
+            _clear_search_cache()
         except Exception as e:
             raise JiraApiError(f"Failed to update issue {issue_key}: {str(e)}")
 
@@ -251,8 +518,9 @@ class JiraClient:
             >>> client.add_comment('DATA-123', 'Work in progress')
         """
         try:
-            issue = self.client.issue(issue_key)
-            self.client.add_comment(issue, comment_text)
+            # add_comment accepts the key, so the issue does not need to be fetched
+            self.client.add_comment(issue_key, comment_text)
+            _clear_search_cache()
         except Exception as e:
             raise JiraApiError(f"Failed to add comment to {issue_key}: {str(e)}")
 
@@ -271,26 +539,44 @@ class JiraClient:
         Example:
             >>> client.export_issues('project = DATA', 'issues.csv')
         """
+        # Rows are written to a temporary file that replaces output_file once
+        # every page has been fetched, so a failed search leaves it untouched
+        path = Path(output_file)
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
         try:
-            issues = self.search_issues(jql)
+            # Pages are fetched as rows are written, so only one page of issues
+            # is held in memory however large the export is
+            issues = self.iter_raw_issues(
+                jql, page_size=100, fields=['summary', 'status', 'priority', 'assignee', 'created', 'updated'])
             
-            with open(output_file, 'w', newline='') as f:
+            # A large write buffer turns the export into a few big writes
+            with open(tmp_path, 'w', newline='', buffering=1 << 23) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Key', 'Summary', 'Status', 'Priority', 'Assignee', 'Created', 'Updated'])
-                
-                for issue in issues:
-                    writer.writerow([
-                        issue.key,
-                        issue.fields.summary,
-                        issue.fields.status.name,
-                        getattr(issue.fields.priority, 'name', 'None'),
-                        getattr(issue.fields.assignee, 'displayName', 'Unassigned'),
-                        issue.fields.created,
-                        issue.fields.updated
-                    ])
+                writer.writerows(self._export_row(issue['key'], issue['fields']) for issue in issues)
+            os.replace(tmp_path, path)
         except Exception as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             raise JiraApiError(f"Failed to export issues: {str(e)}")
 
+    @staticmethod
+    def _export_row(key: str, fields: Dict[str, Any]) -> Tuple[str, ...]:
+        """Build an export CSV row from an issue key and its raw fields"""
+        priority = fields.get('priority') or {}
+        assignee = fields.get('assignee') or {}
+        return (
+            key,
+            fields['summary'],
+            fields['status']['name'],
+            priority.get('name', 'None'),
+            assignee.get('displayName', 'Unassigned'),
+            fields['created'],
+            fields['updated']
+        )
+
     def add_attachment(self, issue_key: str, file_path: Union[str, BinaryIO]) -> None:
         """
         Attach a file to a Jira issue.
@@ -372,34 +658,166 @@ class JiraClient:
             >>> print(f"Updated {count} issues")
         """
         try:
-            issues = self.search_issues(jql)
-            updated = 0
-            
-            for issue in issues:
-                fields = {}
-                if status:
-                    self.transition_issue(issue.key, status)
-                if assignee:
-                    fields['assignee'] = {'name': assignee}
-                if add_labels:
-                    current_labels = getattr(issue.fields, 'labels', [])
-                    new_labels = add_labels.split(',')
-                    fields['labels'] = list(set(current_labels + new_labels))
-                
-                if fields:
-                    self.update_issue(issue.key, fields)
-                    updated += 1
-            
+            issues = self.search_issues(jql, fields=['labels', 'project', 'issuetype', 'status'])
+            updated, errors = self._apply_updates(
+                issues, status, assignee, _split_labels(add_labels), concurrent=True)
+            if errors:
+                raise JiraApiError(
+                    f"Failed to update {len(errors)} of {len(issues)} issues: "
+                    f"{'; '.join(f'{key}: {error}' for key, error in errors.items())}")
             return updated
         except Exception as e:
             raise JiraApiError(f"Bulk update failed: {str(e)}")
 
-    def get_transitions(self, issue_key: str) -> List[Resource]:
+    def _run_concurrent(self, fn: Callable[[T], R], items: List[T], max_workers: int = 10) -> List[R]:
+        """
+        Apply a function to items on a thread pool.
+
+        Jira calls are I/O bound, so threads overlap the HTTP round trips.
+
+        Args:
+            fn (Callable[[T], R]): Function to call for each item
+            items (List[T]): Items to process
+            max_workers (int, optional): Maximum number of threads. Defaults to 10.
+
+        Returns:
+            List[R]: Results in the same order as items
+        """
+        if len(items) < 2:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(fn, items))
+
+    def _apply_update(self, issue: 'Issue', status: Optional[str] = None,
+                      assignee: Optional[str] = None, new_labels: Optional[List[str]] = None) -> bool:
+        """
+        Apply a bulk update to a single issue.
+
+        Labels in new_labels are appended to the issue's labels in order,
+        skipping ones it already has.
+
+        Returns:
+            bool: True if issue fields were updated, False if only transitioned
+        """
+        fields = {}
+        if assignee:
+            fields['assignee'] = {'name': assignee}
+        if new_labels:
+            current_labels = getattr(issue.fields, 'labels', None) or []
+            fields['labels'] = list(dict.fromkeys([*current_labels, *new_labels]))
+        
+        if status:
+            # Jira only accepts fields on the transition's screen; when they all
+            # are, the transition sets them in the same request
+            if self._transition_with_cache(issue, status, fields):
+                return True
+        if fields:
+            self.update_issue(issue.key, fields)
+            return True
+        return False
+
+    def _apply_updates(self, issues: List['Issue'], status: Optional[str] = None,
+                       assignee: Optional[str] = None, new_labels: Optional[List[str]] = None,
+                       concurrent: bool = False) -> Tuple[int, Dict[str, str]]:
+        """
+        Apply a bulk update to each issue, continuing past issues that fail.
+
+        Args:
+            issues (List[Issue]): Issues to update
+            status (Optional[str]): New status to set
+            assignee (Optional[str]): New assignee username
+            new_labels (Optional[List[str]]): Labels to add
+            concurrent (bool): Update the issues on a thread pool instead of in order
+
+        Returns:
+            Tuple[int, Dict[str, str]]: Number of issues whose fields were updated,
+                and the error message for each issue key that failed
+        """
+        def apply(issue: 'Issue') -> Tuple[bool, Optional[str]]:
+            try:
+                return self._apply_update(issue, status, assignee, new_labels), None
+            except Exception as e:
+                return False, str(e)
+        
+        results = self._run_concurrent(apply, issues) if concurrent else [apply(issue) for issue in issues]
+        errors = {issue.key: error for issue, (_, error) in zip(issues, results) if error}
+        return sum(updated for updated, _ in results), errors
+
+    def _transitions_for(self, issue: 'Issue') -> Tuple[Dict[str, str], Dict[str, FrozenSet[str]]]:
+        """
+        Get available transition IDs by name for an issue, and the fields on each
+        transition's screen by ID, shared across issues in the same workflow state.
+
+        Transitions depend on the workflow (project and issue type) and the
+        current status, so issues fetched with those fields share one lookup.
+        Issues fetched without them fall back to a lookup per issue.
+        """
+        try:
+            fields = issue.fields
+            key = (fields.project.key, fields.issuetype.id, fields.status.id)
+        except AttributeError:
+            return self._transition_lookup(self.get_transitions(issue.key, with_fields=True))
+        
+        lookup = self._transitions_cache.get(key)
+        if lookup is None:
+            lookup = self._transitions_cache[key] = self._transition_lookup(
+                self.get_transitions(issue.key, with_fields=True))
+        return lookup
+
+    def _transition_with_cache(self, issue: 'Issue', transition_name: str,
+                               fields: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Transition an issue using the transitions cached for its workflow state.
+
+        The fields are set by the same request if the transition's screen has
+        all of them; otherwise they are left for the caller to update.
+
+        Returns:
+            bool: True if the fields were set with the transition
+        """
+        transition_ids, screens = self._transitions_for(issue)
+        transition_id = self._find_transition_id(transition_ids, transition_name)
+        screen = screens.get(transition_id, frozenset())
+        with_fields = fields is not None and bool(fields) and screen.issuperset(fields)
+        try:
+            self.client.transition_issue(issue.key, transition_id, fields=fields if with_fields else {})
+            _clear_search_cache()
+        except Exception as e:
+            raise JiraApiError(f"Failed to transition {issue.key}: {str(e)}")
+        return with_fields
+
+    @staticmethod
+    def _transition_lookup(transitions: List['Resource']) -> Tuple[Dict[str, str], Dict[str, FrozenSet[str]]]:
+        """Map transition names to IDs, and transition IDs to the field IDs on their screens"""
+        screens = {t['id']: frozenset(t.get('fields') or ()) for t in transitions}
+        return JiraClient._transition_ids(transitions), screens
+
+    @staticmethod
+    def _transition_ids(transitions: List['Resource']) -> Dict[str, str]:
+        """Map lowercased transition names to IDs, keeping the first of any duplicate names"""
+        return {t['name'].lower(): t['id'] for t in reversed(transitions)}
+
+    @staticmethod
+    def _find_transition_id(transition_ids: Dict[str, str], transition_name: str) -> str:
+        """
+        Find the ID of a transition by name, ignoring case.
+
+        Raises:
+            ValidationError: If no transition has the given name
+        """
+        transition_id = transition_ids.get(transition_name.lower())
+        if transition_id is None:
+            raise ValidationError(f"Transition '{transition_name}' not found")
+        return transition_id
+
+    def get_transitions(self, issue_key: str, with_fields: bool = False) -> List['Resource']:
         """
         Get available transitions for an issue.
 
         Args:
             issue_key (str): The issue key to get transitions for
+            with_fields (bool): Include the fields on each transition's screen,
+                under the transition's 'fields' key
 
         Returns:
             List[Resource]: List of available transitions
@@ -413,11 +831,13 @@ class JiraClient:
             ...     print(f"{t['id']}: {t['name']} -> {t['to']['name']}")
         """
         try:
-            return self.client.transitions(issue_key)
+            return self.client.transitions(issue_key, expand='transitions.fields' if with_fields else None)
         except Exception as e:
             raise JiraApiError(f"Failed to get transitions for {issue_key}: {str(e)}")
 
-    def transition_issue(self, issue_key: str, transition_name: str, resolution: Optional[str] = None) -> None:
+    def transition_issue(self, issue_key: str, transition_name: str, resolution: Optional[str] = None,
+                         transitions: Optional[List['Resource']] = None,
+                         fields: Optional[Dict[str, Any]] = None) -> None:
         """
         Transition an issue to a new status.
 
@@ -425,6 +845,10 @@ class JiraClient:
             issue_key (str): The issue key to transition
             transition_name (str): Name of the transition to perform
             resolution (Optional[str]): Resolution to set (for Done transitions)
+            transitions (Optional[List[Resource]]): Transitions already fetched for
+                the issue, to skip looking them up again
+            fields (Optional[Dict[str, Any]]): Other fields to set with the
+                transition; they must be on the transition's screen
 
         Raises:
             JiraApiError: If transition fails
@@ -435,26 +859,20 @@ class JiraClient:
             >>> client.transition_issue('DATA-123', 'Done', resolution='Fixed')
         """
         try:
-            transitions = self.get_transitions(issue_key)
-            transition_id = None
-            
-            for t in transitions:
-                if t['name'].lower() == transition_name.lower():
-                    transition_id = t['id']
-                    break
-            
-            if not transition_id:
-                raise ValidationError(f"Transition '{transition_name}' not found")
+            if transitions is None:
+                transitions = self.get_transitions(issue_key)
+            transition_id = self._find_transition_id(self._transition_ids(transitions), transition_name)
             
-            fields = {}
+            fields = dict(fields or {})
             if resolution:
                 fields['resolution'] = {'name': resolution}
             
             self.client.transition_issue(issue_key, transition_id, fields=fields)
+            _clear_search_cache()
         except Exception as e:
             raise JiraApiError(f"Failed to transition {issue_key}: {str(e)}")
 
-    def get_sprints(self, board_id: int, state: Optional[str] = None) -> List[Resource]:
+    def get_sprints(self, board_id: int, state: Optional[str] = None) -> List['Resource']:
         """
         Get sprints for a board.
 
@@ -494,10 +912,11 @@ class JiraClient:
         """
         try:
             self.client.add_issues_to_sprint(sprint_id, issue_keys)
+            _clear_search_cache()
         except Exception as e:
             raise JiraApiError(f"Failed to add issues to sprint {sprint_id}: {str(e)}")
 
-    def create_sprint(self, board_id: int, name: str, start_date: Optional[str] = None) -> Resource:
+    def create_sprint(self, board_id: int, name: str, start_date: Optional[str] = None) -> 'Resource':
         """
         Create a new sprint.
 
@@ -527,83 +946,37 @@ class JiraClient:
         except Exception as e:
             raise JiraApiError(f"Failed to create sprint: {str(e)}")
 
-    def get_field_map(self, issue_key: Optional[str] = None) -> Dict[str, Any]:
-        """Get all fields and their IDs, optionally with values from a specific issue"""
-        try:
-            # Get all fields
-            fields = self.client.fields()
-            
-            # Create field map
-            field_map = {}
-            for field in fields:
-                # Handle fields that might not have all attributes
-                field_info = {
-                    'id': field.get('id', 'unknown'),
-                    'name': field.get('name', 'unknown'),
-                    'type': field.get('schema', {}).get('type', 'unknown') if 'schema' in field else 'unknown',
-                    'custom': field.get('custom', False)
-                }
-                
-                # If issue key provided, get the value
-                if issue_key:
-                    try:
-                        issue = self.get_issue(issue_key)
-                        # Convert field ID to a valid Python attribute name
-                        field_attr = field['id'].replace('-', '_').replace('.', '_')
-                        value = getattr(issue.fields, field_attr, None)
-                        
-                        if value is not None:
-                            if hasattr(value, 'value'):  # Handle custom field objects
-                                field_info['value'] = value.value
-                            elif hasattr(value, 'name'):  # Handle named resources (e.g., users, priorities)
-                                field_info['value'] = value.name
-                            elif isinstance(value, (list, dict)):  # Handle complex fields
-                                field_info['value'] = str(value)
-                            else:  # Handle simple values
-                                field_info['value'] = str(value)
-                    except Exception as e:
-                        field_info['value'] = f"Error getting value: {str(e)}"
-                
-                field_map[field['name']] = field_info
-            
-            return field_map
-        except Exception as e:
-            raise JiraApiError(f"Failed to get field map: {str(e)}")
-
-    def bulk_update_batch(self, issues: List[Issue], status: Optional[str] = None,
-                         assignee: Optional[str] = None, add_labels: Optional[str] = None) -> None:
+    def bulk_update_batch(self, issues: List['Issue'], status: Optional[str] = None,
+                         assignee: Optional[str] = None, add_labels: Optional[str] = None) -> Dict[str, str]:
         """
         Update a batch of issues.
 
+        Every issue is attempted; one that fails does not stop the others.
+
         Args:
             issues (List[Issue]): List of issues to update
             status (Optional[str]): New status to set
             assignee (Optional[str]): New assignee username
             add_labels (Optional[str]): Comma-separated labels to add
 
+        Returns:
+            Dict[str, str]: Error message by issue key for the issues that could
+                not be updated; the rest of the batch was updated
+
         Raises:
             JiraApiError: If batch update fails
 
         Example:
             >>> issues = client.search_issues('project = DATA')
-            >>> client.bulk_update_batch(issues, status='In Progress')
+            >>> failed = client.bulk_update_batch(issues, status='In Progress')
+            >>> for key, error in failed.items():
+            ...     print(f"{key}: {error}")
         """
         try:
-            for issue in issues:
-                fields = {}
-                if status:
-                    self.transition_issue(issue.key, status)
-                if assignee:
-                    fields['assignee'] = {'name': assignee}
-                if add_labels:
-                    current_labels = getattr(issue.fields, 'labels', [])
-                    new_labels = add_labels.split(',')
-                    fields['labels'] = list(set(current_labels + new_labels))
-                
-                if fields:
-                    self.update_issue(issue.key, fields)
+            _, errors = self._apply_updates(issues, status, assignee, _split_labels(add_labels))
         except Exception as e:
             raise JiraApiError(f"Failed to update batch: {str(e)}")
+        return errors
 
     def get_velocity_metrics(self, board_id: int, days: int = 14) -> List[Dict[str, Any]]:
         """
@@ -631,39 +1004,34 @@ class JiraClient:
             >>> for m in metrics:
             ...     print(f"{m['name']}: {m['completed_points']} points")
         """
+        def sprint_metrics(sprint: 'Resource') -> Dict[str, Any]:
+            # Get issues completed in sprint
+            jql = (
+                f"sprint = {sprint.id} AND "
+                f"status = Done AND "
+                f"updated >= -{days}d"
+            )
+            completed_points = 0
+            completed_issues = 0
+            for issue in self.iter_raw_issues(jql, fields=['customfield_10000']):
+                completed_points += issue['fields'].get('customfield_10000') or 0
+                completed_issues += 1
+            average_points = (
+                completed_points / completed_issues 
+                if completed_issues > 0 else 0
+            )
+            
+            return {
+                'name': sprint.name,
+                'completed_points': completed_points,
+                'completed_issues': completed_issues,
+                'average_points': average_points
+            }
+        
         try:
-            # Get completed sprints
+            # Get completed sprints; each sprint's issues are searched independently
             sprints = self.get_sprints(board_id, state='closed')
-            metrics = []
-            
-            for sprint in sprints:
-                # Get issues completed in sprint
-                jql = (
-                    f"sprint = {sprint.id} AND "
-                    f"status = Done AND "
-                    f"updated >= -{days}d"
-                )
-                issues = self.search_issues(jql)
-                
-                # Calculate metrics
-                completed_points = sum(
-                    getattr(issue.fields, 'customfield_10000', 0) or 0 
-                    for issue in issues
-                )
-                completed_issues = len(issues)
-                average_points = (
-                    completed_points / completed_issues 
-                    if completed_issues > 0 else 0
-                )
-                
-                metrics.append({
-                    'name': sprint.name,
-                    'completed_points': completed_points,
-                    'completed_issues': completed_issues,
-                    'average_points': average_points
-                })
-            
-            return metrics
+            return self._run_concurrent(sprint_metrics, sprints)
         except Exception as e:
             raise JiraApiError(f"Failed to get velocity metrics: {str(e)}")
 
@@ -690,6 +1058,7 @@ class JiraClient:
                 inwardIssue=issue_key,
                 outwardIssue=target_issue
             )
+            _clear_search_cache()
         except Exception as e:
             raise JiraApiError(f"Failed to create link: {str(e)}")
 
@@ -729,13 +1098,38 @@ class JiraClient:
         except Exception as e:
             raise JiraApiError(f"Failed to remove watcher from {issue_key}: {str(e)}")
 
+    def _field_definitions(self) -> List[Dict[str, Any]]:
+        """
+        Get the Jira field definitions, reusing them for _FIELDS_CACHE_TTL seconds.
+
+        The definitions rarely change and the response is large, so repeated
+        lookups on the same client share one request.
+        """
+        cached = self._fields_cache
+        if cached is not None and time.monotonic() - cached[0] < _FIELDS_CACHE_TTL:
+            return cached[1]
+        fields = self.client.fields()
+        self._fields_cache = (time.monotonic(), fields)
+        return fields
+
+    def invalidate_fields_cache(self) -> None:
+        """
+        Drop the cached field definitions, so the next lookup fetches them again.
+
+        Example:
+            >>> client.invalidate_fields_cache()
+            >>> fields = client.get_field_map()
+        """
+        self._fields_cache = None
+
     def get_field_map(self, issue_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         Get all fields and their IDs, optionally with values from a specific issue.
 
         This method retrieves all available Jira fields and their metadata,
         including custom fields. If an issue key is provided, it also retrieves
-        the current values of these fields for that issue.
+        the current values of these fields for that issue. Field definitions
+        are cached on the client; see invalidate_fields_cache.
 
         Args:
             issue_key (Optional[str]): Issue key to get field values from
@@ -757,9 +1151,18 @@ class JiraClient:
             >>> field_values = client.get_field_map('DATA-123')
         """
         try:
-            fields = self.client.fields()
+            fields = self._field_definitions()
             field_map = {}
             
+            # Fetch the issue once; its raw field dict is keyed by field ID
+            raw_values: Dict[str, Any] = {}
+            value_error: Optional[str] = None
+            if issue_key:
+                try:
+                    raw_values = self.get_issue(issue_key).raw['fields']
+                except Exception as e:
+                    value_error = f"Error getting value: {str(e)}"
+            
             for field in fields:
                 field_info = {
                     'id': field.get('id', 'unknown'),
@@ -768,23 +1171,12 @@ class JiraClient:
                     'custom': field.get('custom', False)
                 }
                 
-                if issue_key:
-                    try:
-                        issue = self.get_issue(issue_key)
-                        field_attr = field['id'].replace('-', '_').replace('.', '_')
-                        value = getattr(issue.fields, field_attr, None)
-                        
-                        if value is not None:
-                            if hasattr(value, 'value'):
-                                field_info['value'] = value.value
-                            elif hasattr(value, 'name'):
-                                field_info['value'] = value.name
-                            elif isinstance(value, (list, dict)):
-                                field_info['value'] = str(value)
-                            else:
-                                field_info['value'] = str(value)
-                    except Exception as e:
-                        field_info['value'] = f"Error getting value: {str(e)}"
+                if value_error:
+                    field_info['value'] = value_error
+                elif issue_key:
+                    value = raw_values.get(field_info['id'])
+                    if value is not None:
+                        field_info['value'] = _field_value(value)
                 
                 field_map[field['name']] = field_info
             
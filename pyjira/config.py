@@ -13,16 +13,20 @@ The module provides functions to:
 - Support custom template paths
 """
 
-import os
-import yaml
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 from .exceptions import ConfigurationError
 
+@functools.lru_cache(maxsize=None)
+def jira_dir() -> Path:
+    """Get the per-user pyjira directory (~/.jira), resolved once per process"""
+    return Path.home() / '.jira'
+
 def get_config_path() -> Path:
     """Get the path to the config file"""
     # Check for config in user's home directory
-    home_config = Path.home() / '.jira' / 'config.yaml'
+    home_config = jira_dir() / 'config.yaml'
     if home_config.exists():
         return home_config
     
@@ -34,8 +38,34 @@ def get_config_path() -> Path:
     # Return default home config path
     return home_config
 
-def load_config(config_path: str = None) -> Dict[str, Any]:
-    """Load configuration from YAML file"""
+def _load_yaml(stream: Any) -> Any:
+    """Parse YAML with the libyaml-backed safe loader when PyYAML has it"""
+    # Imported on first use: commands that never read a config file or
+    # template do not pay for loading PyYAML
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+def _dump_yaml(data: Any, stream: Any) -> None:
+    """Write YAML with the libyaml-backed safe dumper when PyYAML has it"""
+    import yaml
+    yaml.dump(data, stream, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
+
+@functools.lru_cache(maxsize=128)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached per absolute path, modification time and size"""
+    with open(path, 'r') as f:
+        return _load_yaml(f) or {}
+
+def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load configuration from YAML file.
+
+    Parsed files are cached by absolute path, modification time and size, so
+    repeated lookups (aliases, templates) parse each file only once per process
+    while edits to the file are still picked up. The returned dict is shared
+    between callers and must not be modified; ``load_config.cache_clear()``
+    drops every cached file.
+    """
     try:
         # If specific path provided, use it
         if config_path:
@@ -43,8 +73,10 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         else:
             config_file = get_config_path()
         
-        # Create default config if it doesn't exist
-        if not config_file.exists():
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            # Create default config if it doesn't exist
             config_file.parent.mkdir(parents=True, exist_ok=True)
             default_config = {
                 'aliases': {
@@ -58,17 +90,60 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
                 }
             }
             with open(config_file, 'w') as f:
-                yaml.safe_dump(default_config, f)
+                _dump_yaml(default_config, f)
             return default_config
         
         # Load existing config
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f) or {}
+        return _load_cached(str(config_file.absolute()), stat.st_mtime_ns, stat.st_size)
             
     except Exception as e:
         raise ConfigurationError(f"Failed to load config: {str(e)}")
 
-def get_template(template_name: str) -> Dict[str, Any]:
+load_config.cache_clear = _load_cached.cache_clear  # type: ignore[attr-defined]
+
+# Plain YAML scalars that resolve to something other than a string
+_NON_STRING_WORDS = frozenset(('y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false', 'null', '~'))
+
+def _is_plain_key(key: str) -> bool:
+    """Check a mapping key is an identifier that YAML loads as the same string"""
+    return (key[:1].isalpha() and key.replace('_', '').isalnum()
+            and key.lower() not in _NON_STRING_WORDS)
+
+def _is_plain_text(value: str) -> bool:
+    """Check a value is text that YAML loads as the same string"""
+    # Starting with a letter rules out quotes, tags, anchors, aliases, block
+    # scalars, flow collections and numbers; the rest rules out comments,
+    # nested mappings and booleans or nulls
+    return (value[:1].isalpha()
+            and ': ' not in value and ' #' not in value and value[-1] != ':'
+            and value.lower() not in _NON_STRING_WORDS)
+
+def _parse_flat_mapping(text: str) -> Optional[Dict[str, str]]:
+    """
+    Parse a flat mapping of string fields without invoking the YAML parser.
+
+    Only lines of the form ``key: some text`` are handled, where both the key
+    and the value would load as plain strings. Returns None for anything else
+    (nesting, lists, quoting, comments, numbers, booleans, ...) so the caller
+    can fall back to a full YAML load.
+    """
+    result: Dict[str, str] = {}
+    for line in text.split('\n'):
+        line = line[:-1] if line[-1:] == '\r' else line
+        # Tabs, control characters and the other line breaks YAML knows
+        # (which str.splitlines and str.strip would also act on) are left to YAML
+        if not line.isprintable():
+            return None
+        if not line.strip(' '):
+            continue
+        key, sep, value = line.partition(': ')
+        value = value.strip(' ')
+        if not sep or not _is_plain_key(key) or not _is_plain_text(value):
+            return None
+        result[key] = value
+    return result
+
+def get_template(template_name: str) -> Optional[Dict[str, Any]]:
     """
     Load a specific issue template configuration.
 
@@ -79,19 +154,39 @@ def get_template(template_name: str) -> Dict[str, Any]:
         template_name (str): Name of the template to load (without .yaml extension)
 
     Returns:
-        Dict[str, Any]: Template configuration containing:
+        Optional[Dict[str, Any]]: Template configuration containing:
             - Issue type settings
             - Field defaults
             - Description templates
             - Custom field values
 
+        None is returned if the template does not exist, and an empty dict
+        if the template file is empty.
+
     Raises:
-        yaml.YAMLError: If the template file is invalid
-        OSError: If template file is not accessible
+        ConfigurationError: If the template file is invalid or not accessible
 
     Example:
         >>> bug_template = get_template('bug')
         >>> feature_template = get_template('feature')
     """
-    template_path = os.path.expanduser(f'~/.jira/templates/{template_name}.yaml')
-    return load_config(template_path)
\ No newline at end of file
+    template_path = jira_dir() / 'templates' / f'{template_name}.yaml'
+    # Open directly rather than checking for the file first; a missing
+    # template costs a single failed open
+    try:
+        with open(template_path, 'r') as f:
+            text = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        raise ConfigurationError(f"Failed to load template '{template_name}': {str(e)}")
+    # Most templates are a handful of flat text fields, which don't need PyYAML
+    fields = _parse_flat_mapping(text)
+    if fields is None:
+        try:
+            fields = _load_yaml(text) or {}
+        except Exception as e:
+            raise ConfigurationError(f"Failed to load template '{template_name}': {str(e)}")
+        if not isinstance(fields, dict):
+            raise ConfigurationError(f"Failed to load template '{template_name}': expected a mapping of fields")
+    return fields
\ No newline at end of file
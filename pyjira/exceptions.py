@@ -15,6 +15,21 @@ The exception hierarchy is:
 
 from typing import Any
 
+_CONFIG_ERROR_TEMPLATE = """
+Configuration Error: {message}
+
+Common fixes:
+1. Copy .env.example to .env:
+   cp .env.example .env
+
+2. Edit .env with your credentials:
+   - JIRA_SERVER: Your Jira instance URL (e.g., https://your-domain.atlassian.net)
+   - JIRA_EMAIL: Your Atlassian account email
+   - JIRA_API_TOKEN: API token from https://id.atlassian.com/manage/api-tokens
+
+3. Make sure the .env file is in your current directory
+"""
+
 class JiraCliError(Exception):
     """
     Base exception class for all Jira CLI errors.
@@ -28,8 +43,6 @@ class JiraCliError(Exception):
     Example:
         >>> raise JiraCliError("An error occurred")
     """
-    def __init__(self, message: str) -> None:
-        super().__init__(message)
 
 class ConfigurationError(JiraCliError):
     """
@@ -45,21 +58,13 @@ class ConfigurationError(JiraCliError):
     Example:
         >>> raise ConfigurationError("Missing JIRA_SERVER variable")
     """
-    def __str__(self) -> str:
-        return f"""
-Configuration Error: {self.args[0]}
-
-Common fixes:
-1. Copy .env.example to .env:
-   cp .env.example .env
-
-2. Edit .env with your credentials:
-   - JIRA_SERVER: Your Jira instance URL (e.g., https://your-domain.atlassian.net)
-   - JIRA_EMAIL: Your Atlassian account email
-   - JIRA_API_TOKEN: API token from https://id.atlassian.com/manage/api-tokens
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        # The arguments never change, so the help text is rendered once
+        self._rendered = _CONFIG_ERROR_TEMPLATE.format(message=message)
 
-3. Make sure the .env file is in your current directory
-"""
+    def __str__(self) -> str:
+        return self._rendered
 
 class AuthenticationError(JiraCliError):
     """
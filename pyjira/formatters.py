@@ -11,16 +11,54 @@ The module includes:
 - Color-coded and styled terminal output
 """
 
-from rich.console import Console
-from rich.table import Table
+import os
+from rich.cells import cell_len, set_cell_size
+from rich.table import Column, Table
 from rich.panel import Panel
-from rich.markdown import Markdown
-from datetime import datetime
-from typing import Any, List, Dict
-from jira import Issue
-from jira.resources import Resource
+from rich.text import Text
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple, Union, TYPE_CHECKING
 
-console = Console()
+if TYPE_CHECKING:
+    # Only needed for annotations; importing the jira SDK is slow
+    from jira import Issue
+    from jira.resources import Resource
+
+def __getattr__(name: str) -> Any:
+    # Create the shared console on first access rather than at import time
+    if name == 'console':
+        from rich.console import Console
+        globals()['console'] = console = Console()
+        return console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Lists longer than this are laid out as aligned plain text: measuring and
+# wrapping every cell of a Rich table takes seconds for thousands of rows
+_MAX_TABLE_ROWS = 500
+
+# Column headers of the issue list
+_ISSUE_LIST_HEADER = ("Key", "Summary", "Status", "Priority", "Assignee")
+
+def _new_table(*columns: Union[str, Column]) -> Table:
+    """Create a table with a bold header row and the given columns"""
+    return Table(*columns, show_header=True, header_style="bold")
+
+def _fit_cell(text: str, width: int) -> str:
+    """Pad or cut text to exactly width terminal cells, ending a cut with an ellipsis"""
+    if cell_len(text) > width:
+        text = set_cell_size(text, width - 1) + '…'
+    return set_cell_size(text, width)
+
+def _description(description: Optional[str]) -> str:
+    """Get the description to display, cut to JIRA_CLI_MAX_DESCRIPTION characters if set"""
+    if not description:
+        return 'No description provided'
+    try:
+        limit = int(os.getenv('JIRA_CLI_MAX_DESCRIPTION', '0'))
+    except ValueError:
+        limit = 0
+    if 0 < limit < len(description):
+        return f"{description[:limit]}…[truncated]"
+    return description
 
 class IssueFormatter:
     """
@@ -32,7 +70,7 @@ class IssueFormatter:
     """
 
     @staticmethod
-    def format_issue(issue: Issue) -> Panel:
+    def format_issue(issue: 'Issue') -> Panel:
         """
         Format a single issue as a Rich panel with detailed information.
 
@@ -47,56 +85,111 @@ class IssueFormatter:
             >>> panel = formatter.format_issue(issue)
             >>> console.print(panel)
         """
-        panel = Panel(
-            f"""[bold blue]{issue.key}[/bold blue]: {issue.fields.summary}
-[bold]Status:[/bold] {issue.fields.status.name}
-[bold]Type:[/bold] {issue.fields.issuetype.name}
-[bold]Priority:[/bold] {issue.fields.priority.name}
-[bold]Assignee:[/bold] {getattr(issue.fields.assignee, 'displayName', 'Unassigned')}
-[bold]Reporter:[/bold] {issue.fields.reporter.displayName}
-[bold]Created:[/bold] {datetime.strptime(issue.fields.created[:19], '%Y-%m-%dT%H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')}
-
-[bold]Description:[/bold]
-{issue.fields.description or 'No description provided'}
-""",
-            title=f"Issue Details",
-            expand=False
+        fields = issue.fields
+        # Jira timestamps start with a fixed YYYY-MM-DDTHH:MM:SS layout
+        created = fields.created[:19].replace('T', ' ')
+        # Assemble styled segments directly so no markup is parsed, and brackets
+        # in summaries or descriptions are shown as written
+        body = Text.assemble(
+            (issue.key, "bold blue"), f": {fields.summary}\n",
+            ("Status:", "bold"), f" {fields.status.name}\n",
+            ("Type:", "bold"), f" {fields.issuetype.name}\n",
+            ("Priority:", "bold"), f" {fields.priority.name}\n",
+            ("Assignee:", "bold"), f" {getattr(fields.assignee, 'displayName', 'Unassigned')}\n",
+            ("Reporter:", "bold"), f" {fields.reporter.displayName}\n",
+            ("Created:", "bold"), f" {created}\n",
+            "\n",
+            ("Description:", "bold"), f"\n{_description(fields.description)}\n",
         )
+        panel = Panel(body, title="Issue Details", expand=False)
         return panel
 
     @staticmethod
-    def format_issue_list(issues: List[Issue]) -> Table:
+    def format_issue_list(issues: Iterable['Issue'], width: Optional[int] = None) -> Union[Table, Text]:
         """
         Format a list of issues as a Rich table.
 
+        Lists longer than 500 issues are laid out as aligned plain text with
+        the same columns instead, which renders many times faster. Its summary
+        column is cut to fit width.
+
         Args:
-            issues (List[Issue]): List of Jira issues to format
+            issues (Iterable[Issue]): Jira issues to format; any iterable works,
+                including a generator that fetches pages lazily
+            width (Optional[int]): Terminal width to fit long lists to (default:
+                summaries are not cut)
 
         Returns:
-            Table: A Rich table containing the formatted issue list
+            Union[Table, Text]: A Rich table containing the formatted issue list,
+                or aligned text for long lists
 
         Example:
             >>> formatter = IssueFormatter()
-            >>> table = formatter.format_issue_list(issues)
+            >>> table = formatter.format_issue_list(issues, width=console.width)
             >>> console.print(table)
         """
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Key")
-        table.add_column("Summary")
-        table.add_column("Status")
-        table.add_column("Priority")
-        table.add_column("Assignee")
+        rows = [*IssueFormatter.issue_list_rows(issues)]
+        if len(rows) > _MAX_TABLE_ROWS:
+            return IssueFormatter._issue_list_text(rows, width)
+        
+        # Keys never wrap, so the column is exactly as wide as the longest key.
+        # Sizing it from the plain strings here spares Rich from measuring
+        # every key cell; the wrapping columns still need Rich's measurement.
+        key_width = max([cell_len("Key"), *(cell_len(row[0]) for row in rows)])
+        table = _new_table(Column("Key", no_wrap=True, width=key_width), *_ISSUE_LIST_HEADER[1:])
+        
+        # Plain Text cells skip markup parsing, which is the bulk of the work for
+        # long lists, and show brackets in summaries as written
+        for row in rows:
+            table.add_row(*map(Text, row))
+        
+        return table
+
+    @staticmethod
+    def _issue_list_text(rows: List[Tuple[str, str, str, str, str]], width: Optional[int]) -> Text:
+        """Lay out issue list rows as text columns under a bold header"""
+        widths = [max(map(cell_len, column)) for column in zip(_ISSUE_LIST_HEADER, *rows)]
+        if width is not None:
+            # Only the summary gives way, so the columns after it stay on screen
+            others = sum(widths) - widths[1] + 2 * (len(widths) - 1)
+            widths[1] = max(cell_len(_ISSUE_LIST_HEADER[1]), min(widths[1], width - others))
+        
+        def line(row: Tuple[str, ...]) -> str:
+            return '  '.join(map(_fit_cell, row, widths)).rstrip()
         
+        text = Text()
+        text.append(line(_ISSUE_LIST_HEADER), style="bold")
+        text.append('\n' + '\n'.join(map(line, rows)))
+        return text
+
+    @staticmethod
+    def issue_list_rows(issues: Iterable['Issue']) -> Iterator[Tuple[str, str, str, str, str]]:
+        """
+        Extract the issue list columns as plain rows.
+
+        Rows are yielded one at a time, so streaming callers never hold more
+        than the row being printed.
+
+        Args:
+            issues (Iterable[Issue]): Jira issues to format
+
+        Yields:
+            Tuple[str, str, str, str, str]: Key, summary, status, priority
+                and assignee for each issue
+
+        Example:
+            >>> for row in IssueFormatter.issue_list_rows(issues):
+            ...     print('\t'.join(row))
+        """
         for issue in issues:
-            table.add_row(
+            fields = issue.fields
+            yield (
                 issue.key,
-                issue.fields.summary,
-                issue.fields.status.name,
-                issue.fields.priority.name,
-                getattr(issue.fields.assignee, 'displayName', 'Unassigned')
+                fields.summary,
+                fields.status.name,
+                fields.priority.name,
+                getattr(fields.assignee, 'displayName', 'Unassigned')
             )
-        
-        return table
 
     @staticmethod
     def format_transitions(transitions: List[Dict[str, Any]]) -> Table:
@@ -114,22 +207,18 @@ class IssueFormatter:
             >>> table = formatter.format_transitions(transitions)
             >>> console.print(table)
         """
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("To Status", style="yellow")
+        table = _new_table(
+            Column("ID", style="cyan"), Column("Name", style="green"), Column("To Status", style="yellow")
+        )
         
+        add_row = table.add_row
         for t in transitions:
-            table.add_row(
-                str(t['id']),
-                t['name'],
-                t['to']['name']
-            )
+            add_row(str(t['id']), t['name'], t['to']['name'])
         
         return table
 
     @staticmethod
-    def format_sprints(sprints: List[Resource]) -> Table:
+    def format_sprints(sprints: List['Resource']) -> Table:
         """
         Format sprint information as a Rich table.
 
@@ -144,26 +233,24 @@ class IssueFormatter:
             >>> table = formatter.format_sprints(sprints)
             >>> console.print(table)
         """
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("ID")
-        table.add_column("Name")
-        table.add_column("State")
-        table.add_column("Start Date")
-        table.add_column("End Date")
+        table = _new_table("ID", "Name", "State", "Start Date", "End Date")
         
+        add_row = table.add_row
         for sprint in sprints:
-            table.add_row(
+            start = getattr(sprint, 'startDate', None)
+            end = getattr(sprint, 'endDate', None)
+            add_row(
                 str(sprint.id),
                 sprint.name,
                 sprint.state,
-                sprint.startDate[:10] if hasattr(sprint, 'startDate') else 'N/A',
-                sprint.endDate[:10] if hasattr(sprint, 'endDate') else 'N/A'
+                start[:10] if start else 'N/A',
+                end[:10] if end else 'N/A'
             )
         
         return table
 
     @staticmethod
-    def format_issue_markdown(issue: Issue) -> str:
+    def format_issue_markdown(issue: 'Issue') -> str:
         """
         Format an issue as a markdown string.
 
@@ -178,15 +265,16 @@ class IssueFormatter:
             >>> markdown = formatter.format_issue_markdown(issue)
             >>> print(markdown)
         """
-        return f"""# {issue.key}: {issue.fields.summary}
+        fields = issue.fields
+        return f"""# {issue.key}: {fields.summary}
 
-**Status:** {issue.fields.status.name}  
-**Type:** {issue.fields.issuetype.name}  
-**Priority:** {issue.fields.priority.name}  
-**Assignee:** {getattr(issue.fields.assignee, 'displayName', 'Unassigned')}  
-**Reporter:** {issue.fields.reporter.displayName}  
-**Created:** {datetime.strptime(issue.fields.created[:19], '%Y-%m-%dT%H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')}
+**Status:** {fields.status.name}  
+**Type:** {fields.issuetype.name}  
+**Priority:** {fields.priority.name}  
+**Assignee:** {getattr(fields.assignee, 'displayName', 'Unassigned')}  
+**Reporter:** {fields.reporter.displayName}  
+**Created:** {fields.created[:19].replace('T', ' ')}
 
 ## Description
-{issue.fields.description or 'No description provided'}
+{_description(fields.description)}
 """
\ No newline at end of file
@@ -15,6 +15,7 @@ import logging
 import os
 from pathlib import Path
 from typing import Optional
+from .config import jira_dir
 
 def setup_logger() -> logging.Logger:
     """
@@ -34,7 +35,7 @@ def setup_logger() -> logging.Logger:
         >>> logger.info("Application started")
         >>> logger.debug("Debug information")
     """
-    log_dir: Path = Path.home() / '.jira' / 'logs'
+    log_dir: Path = jira_dir() / 'logs'
     log_dir.mkdir(parents=True, exist_ok=True)
     
     log_file: Path = log_dir / 'jira-cli.log'
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock
 from pyjira.client import JiraClient
 from pyjira.formatters import IssueFormatter
+from pyjira.cli import cli, _formatter
 from rich.table import Table
 
 @pytest.fixture
@@ -13,6 +14,7 @@ def mock_jira(monkeypatch):
     # Set up default return values
     mock_client.search_issues.return_value = []
     mock_client.get_field_map.return_value = {}
+    mock_client.bulk_update_batch.return_value = {}
     mock_client.get_issue.return_value = {
         'key': 'TEST-123',
         'fields': {
@@ -41,8 +43,25 @@ def mock_jira(monkeypatch):
     def mock_formatter_factory(*args, **kwargs):
         return mock_formatter
     
-    # Patch at module level where the classes are imported
-    monkeypatch.setattr('pyjira.client.JiraClient.__new__', mock_client_factory)
-    monkeypatch.setattr('pyjira.formatters.IssueFormatter.__new__', mock_formatter_factory)
+    # Replace the classes in their modules; the CLI imports them inside each
+    # command, so it picks up the factories at call time
+    monkeypatch.setattr('pyjira.client.JiraClient', mock_client_factory)
+    monkeypatch.setattr('pyjira.formatters.IssueFormatter', mock_formatter_factory)
     
-    return mock_client
\ No newline at end of file
+    # Drop any formatter cached by an earlier test so this test's mock is used
+    _formatter.cache_clear()
+    
+    return mock_client
+
+@pytest.fixture
+def alias_config(monkeypatch):
+    """Load the given aliases on the next command lookup, as if read from the config"""
+    def configure(aliases):
+        monkeypatch.setattr('pyjira.cli.load_config', lambda: {'aliases': aliases})
+        monkeypatch.setattr('pyjira.cli._aliases_loaded', False)
+        monkeypatch.setattr('pyjira.cli._ALIAS_TARGETS', {})
+        monkeypatch.setattr('pyjira.cli._ALIAS_ERRORS', {})
+        # Registered aliases are dropped again after the test
+        monkeypatch.setattr(cli, 'commands', dict(cli.commands))
+        monkeypatch.setattr(cli, '_commands_snapshot', None)
+    return configure
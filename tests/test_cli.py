@@ -1,5 +1,5 @@
 from click.testing import CliRunner
-from pyjira.cli import cli
+from pyjira.cli import cli, _LIST_FIELDS
 from unittest.mock import Mock
 
 def test_list_basic(mock_jira):
@@ -16,7 +16,7 @@ def test_list_basic(mock_jira):
     result = runner.invoke(cli, ['list'])
     assert result.exit_code == 0
     assert 'TEST-1' in result.output
-    mock_jira.search_issues.assert_called_once_with('assignee = currentUser()')
+    mock_jira.search_issues.assert_called_once_with('assignee = currentUser()', fields=_LIST_FIELDS)
 
 def test_list_with_project(mock_jira):
     """Test list command with project filter"""
@@ -31,7 +31,7 @@ def test_list_with_project(mock_jira):
     result = runner.invoke(cli, ['list', '--project', 'TEST'])
     assert result.exit_code == 0
     assert 'TEST-1' in result.output
-    mock_jira.search_issues.assert_called_once_with('project = TEST')
+    mock_jira.search_issues.assert_called_once_with('project = TEST', fields=_LIST_FIELDS)
 
 def test_list_with_status(mock_jira):
     """Test list command with status filter"""
@@ -46,7 +46,7 @@ def test_list_with_status(mock_jira):
     result = runner.invoke(cli, ['list', '--status', 'In Progress'])
     assert result.exit_code == 0
     assert 'TEST-1' in result.output
-    mock_jira.search_issues.assert_called_once_with("status = 'In Progress'")
+    mock_jira.search_issues.assert_called_once_with("status = 'In Progress'", fields=_LIST_FIELDS)
 
 def test_my_command(mock_jira):
     """Test my command without filters"""
@@ -61,7 +61,7 @@ def test_my_command(mock_jira):
     result = runner.invoke(cli, ['my'])
     assert result.exit_code == 0
     assert 'TEST-1' in result.output
-    mock_jira.search_issues.assert_called_once_with('assignee = currentUser()')
+    mock_jira.search_issues.assert_called_once_with('assignee = currentUser()', fields=_LIST_FIELDS)
 
 def test_my_command_with_status(mock_jira):
     """Test my command with status filter"""
@@ -76,7 +76,7 @@ def test_my_command_with_status(mock_jira):
     result = runner.invoke(cli, ['my', '--status', 'To Do'])
     assert result.exit_code == 0
     assert 'TEST-1' in result.output
-    mock_jira.search_issues.assert_called_once_with("assignee = currentUser() AND status = 'To Do'")
+    mock_jira.search_issues.assert_called_once_with("assignee = currentUser() AND status = 'To Do'", fields=_LIST_FIELDS)
 
 def test_list_with_multiple_filters(mock_jira):
     """Test list command with multiple filters"""
@@ -95,7 +95,15 @@ def test_list_with_multiple_filters(mock_jira):
     ])
     assert result.exit_code == 0
     assert 'TEST-1' in result.output
-    mock_jira.search_issues.assert_called_once_with("project = TEST AND status = 'In Progress'")
+    mock_jira.search_issues.assert_called_once_with("project = TEST AND status = 'In Progress'", fields=_LIST_FIELDS)
+
+def test_list_default_project_from_env(mock_jira, monkeypatch):
+    """Test the default project is read from the environment on each run"""
+    runner = CliRunner()
+    for project in ('ONE', 'TWO'):
+        monkeypatch.setenv('JIRA_DEFAULT_PROJECT', project)
+        runner.invoke(cli, ['list'])
+        mock_jira.search_issues.assert_called_with(f'project = {project}', fields=_LIST_FIELDS)
 
 def test_list_no_results(mock_jira):
     """Test list command when no issues are found"""
@@ -108,7 +116,7 @@ def test_list_no_results(mock_jira):
     ])    
     assert result.exit_code == 1
     assert 'No issues found' in result.output
-    mock_jira.search_issues.assert_called_once_with('project = BADDATA')
+    mock_jira.search_issues.assert_called_once_with('project = BADDATA', fields=_LIST_FIELDS)
 
 def test_list_with_error(mock_jira):
     """Test list command when Jira API raises an error"""
@@ -124,4 +132,335 @@ def test_cli_help(mock_jira):
     runner = CliRunner()
     result = runner.invoke(cli, ['--help'])
     assert result.exit_code == 0
-    assert 'Command line interface for Jira' in result.output
\ No newline at end of file
+    assert 'Command line interface for Jira' in result.output
+
+def test_bulk_update_batches(mock_jira):
+    """Test bulk update counts first and updates fetched issues in batches"""
+    runner = CliRunner()
+    mock_issues = [Mock(key=f'TEST-{i}') for i in range(3)]
+    
+    mock_jira.count_issues.return_value = 3
+    mock_jira.iter_issues.return_value = iter(mock_issues)
+    
+    result = runner.invoke(cli, ['bulk-update', 'status = Open', '--status', 'Done', '--batch-size', '2', '-y'])
+    assert result.exit_code == 0
+    assert 'Successfully updated 3 issues' in result.output
+    mock_jira.count_issues.assert_called_once_with('(status = Open)')
+    assert mock_jira.bulk_update_batch.call_count == 2
+
+def test_bulk_update_continues_after_failed_batch(mock_jira):
+    """Test a failed batch is reported without stopping the remaining batches"""
+    from pyjira.exceptions import JiraApiError
+    runner = CliRunner()
+    mock_issues = [Mock(key=f'TEST-{i}') for i in range(3)]
+    
+    mock_jira.count_issues.return_value = 3
+    mock_jira.iter_issues.return_value = iter(mock_issues)
+    mock_jira.bulk_update_batch.side_effect = [JiraApiError("Failed to update batch: boom"), {}]
+    
+    result = runner.invoke(cli, ['bulk-update', 'status = Open', '--status', 'Done', '--batch-size', '2', '--concurrency', '1', '-y'])
+    assert result.exit_code == 1
+    assert 'Successfully updated 1 issues' in result.output
+    assert 'Failed to update 2 of 3 issues' in result.output
+    assert 'TEST-0: Failed to update batch: boom' in result.output
+    assert 'TEST-1: Failed to update batch: boom' in result.output
+    assert mock_jira.bulk_update_batch.call_count == 2
+
+def test_bulk_update_counts_issues_not_batches(mock_jira):
+    """Test the issues that did update in a partly failed batch are counted"""
+    runner = CliRunner()
+    mock_issues = [Mock(key=f'TEST-{i}') for i in range(3)]
+    
+    mock_jira.count_issues.return_value = 3
+    mock_jira.iter_issues.return_value = iter(mock_issues)
+    mock_jira.bulk_update_batch.side_effect = [{'TEST-1': 'Transition not found'}, {}]
+    
+    result = runner.invoke(cli, ['bulk-update', 'status = Open', '--status', 'Done', '--batch-size', '2', '--concurrency', '1', '-y'])
+    assert result.exit_code == 1
+    assert 'Successfully updated 2 issues' in result.output
+    assert 'Failed to update 1 of 3 issues' in result.output
+    assert 'TEST-1: Transition not found' in result.output
+
+def test_bulk_update_rejects_non_positive_batch_size(mock_jira):
+    """Test a batch size below 1 is a usage error rather than a crash or an empty update"""
+    runner = CliRunner()
+    for batch_size in ('0', '-1'):
+        result = runner.invoke(cli, ['bulk-update', 'status = Open', '--status', 'Done', '--batch-size', batch_size, '-y'])
+        assert result.exit_code == 2
+        assert "Invalid value for '--batch-size'" in result.output
+    mock_jira.count_issues.assert_not_called()
+    mock_jira.bulk_update_batch.assert_not_called()
+
+def test_attach_reports_every_file(mock_jira, tmp_path, monkeypatch):
+    """Test a failed upload is reported alongside the files that were attached"""
+    from pyjira.exceptions import JiraApiError
+    runner = CliRunner()
+    monkeypatch.chdir(tmp_path)
+    files = ['a.txt', 'b.txt', 'c.txt']
+    for file in files:
+        (tmp_path / file).write_text(file)
+    def add_attachment(issue_key, file):
+        if file == 'b.txt':
+            raise JiraApiError(f"Failed to attach file to {issue_key}: too large")
+    mock_jira.add_attachment.side_effect = add_attachment
+
+    result = runner.invoke(cli, ['attach', 'TEST-1', *files])
+    assert result.exit_code == 1
+    assert mock_jira.add_attachment.call_count == 3
+    assert 'Attached a.txt to TEST-1' in result.output
+    assert 'Attached c.txt to TEST-1' in result.output
+    assert 'Attached b.txt' not in result.output
+    assert 'Failed to attach 1 of 3 files' in result.output
+    assert 'b.txt: Failed to attach file to TEST-1: too large' in result.output
+
+def test_fields_custom_only(mock_jira):
+    """Test fields command lists only custom fields when requested"""
+    runner = CliRunner()
+    mock_jira.get_field_map.return_value = {
+        'Summary': {'id': 'summary', 'name': 'Summary', 'type': 'string', 'custom': False},
+        'Story Points': {'id': 'customfield_10000', 'name': 'Story Points', 'type': 'number', 'custom': True}
+    }
+    
+    result = runner.invoke(cli, ['fields', '--custom-only'])
+    assert result.exit_code == 0
+    assert 'customfield_10000' in result.output
+    assert 'summary' not in result.output
+
+def test_alias_placeholders(mock_jira, monkeypatch):
+    """Test alias placeholders are filled from the alias arguments"""
+    from pyjira.cli import _ALIAS_TARGETS, _compile_placeholders
+    runner = CliRunner()
+    monkeypatch.setitem(_ALIAS_TARGETS, 'show', ('view', cli.commands['view'], ['{issue}', '-f', 'markdown'], {0: _compile_placeholders('{issue}')}))
+    
+    result = runner.invoke(cli, ['run', 'show', 'TEST-7'])
+    assert result.exit_code == 0
+    mock_jira.get_issue.assert_called_once_with('TEST-7')
+    
+    result = runner.invoke(cli, ['run', 'show'])
+    assert result.exit_code != 0
+    assert "Not enough arguments" in result.output
+
+def test_alias_targeting_alias(mock_jira, alias_config):
+    """Test an alias whose command is another alias, invoked directly and through run"""
+    alias_config({'mine': 'list --assignee="currentUser()"', 'mine2': 'mine'})
+    runner = CliRunner()
+    
+    for args in (['mine2'], ['run', 'mine2']):
+        mock_jira.search_issues.reset_mock()
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 1
+        assert 'No issues found' in result.output
+        mock_jira.search_issues.assert_called_once_with('assignee = currentUser()', fields=_LIST_FIELDS)
+
+def test_broken_alias_only_fails_when_run(mock_jira, alias_config):
+    """Test an unparsable alias leaves help and other aliases working"""
+    alias_config({'bad': 'list --query="unclosed', 'empty': '', 'mine': 'list --assignee="currentUser()"'})
+    runner = CliRunner()
+    
+    result = runner.invoke(cli, ['--help'])
+    assert result.exit_code == 0
+    assert 'mine' in result.output
+    
+    result = runner.invoke(cli, ['mine'])
+    assert result.exit_code == 1
+    mock_jira.search_issues.assert_called_once_with('assignee = currentUser()', fields=_LIST_FIELDS)
+    
+    for alias_name in ('bad', 'empty'):
+        result = runner.invoke(cli, [alias_name])
+        assert result.exit_code == 2
+        assert f"Invalid alias '{alias_name}'" in result.output
+
+def test_builtin_command_wins_over_alias(mock_jira, alias_config):
+    """Test an alias named like a built-in command is ignored, directly and through run"""
+    alias_config({'view': 'list --assignee="currentUser()"'})
+    runner = CliRunner()
+    
+    for args in (['view', 'TEST-1'], ['run', 'view', 'TEST-1']):
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+    assert mock_jira.get_issue.call_count == 2
+    mock_jira.search_issues.assert_not_called()
+
+def test_list_large_result_table_output(mock_jira):
+    """Test large result sets are still printed as a table unless plain output is asked for"""
+    from pyjira.formatters import IssueFormatter
+    runner = CliRunner()
+    mock_jira.search_issues.return_value = [Mock()] * 501
+    formatter = IssueFormatter()
+    
+    result = runner.invoke(cli, ['list'])
+    assert result.exit_code == 0
+    assert 'Key' in result.output
+    formatter.format_issue_list.assert_called_once()
+    formatter.issue_list_rows.assert_not_called()
+
+def test_format_long_issue_list_as_text():
+    """Test lists over 500 issues are laid out as aligned text with the table's columns"""
+    from rich.table import Table
+    from rich.text import Text
+    from pyjira.formatters import IssueFormatter
+    def make_issue(n, summary):
+        issue = Mock()
+        issue.key = f'TEST-{n}'
+        issue.fields.summary = summary
+        issue.fields.status.name = 'To Do'
+        issue.fields.priority.name = 'High'
+        issue.fields.assignee = None
+        return issue
+    issues = [make_issue(n, '[b]Short[/b]' if n % 2 else 'A long summary ' * 10) for n in range(501)]
+    
+    assert isinstance(IssueFormatter.format_issue_list(issues[:500]), Table)
+    text = IssueFormatter.format_issue_list(issues, width=80)
+    assert isinstance(text, Text)
+    lines = text.plain.split('\n')
+    assert len(lines) == 502
+    assert lines[0].split() == ['Key', 'Summary', 'Status', 'Priority', 'Assignee']
+    assert lines[2] == 'TEST-1    [b]Short[/b]' + ' ' * 28 + '  To Do   High      Unassigned'
+    assert lines[1].startswith('TEST-0    A long summary') and lines[1].endswith('…  To Do   High      Unassigned')
+    assert max(map(len, lines)) == 80
+    assert [span.style for span in text.spans] == ['bold']
+
+def test_list_plain_output_env(mock_jira, monkeypatch):
+    """Test JIRA_CLI_PLAIN prints lists as tab-separated rows"""
+    from pyjira.formatters import IssueFormatter
+    monkeypatch.setenv('JIRA_CLI_PLAIN', '1')
+    runner = CliRunner()
+    mock_jira.search_issues.return_value = [Mock()]
+    formatter = IssueFormatter()
+    formatter.issue_list_rows.return_value = [('TEST-1', 'Test 1', 'To Do', 'High', 'Unassigned')]
+    
+    result = runner.invoke(cli, ['list'])
+    assert result.exit_code == 0
+    assert result.output == 'TEST-1\tTest 1\tTo Do\tHigh\tUnassigned\n'
+    formatter.format_issue_list.assert_not_called()
+
+def test_builtin_command_skips_alias_config(mock_jira, monkeypatch):
+    """Test built-in commands run without loading aliases from the config"""
+    load_config = Mock(return_value={})
+    monkeypatch.setattr('pyjira.cli._aliases_loaded', False)
+    monkeypatch.setattr('pyjira.cli.load_config', load_config)
+    runner = CliRunner()
+    
+    result = runner.invoke(cli, ['view', 'TEST-1', '-f', 'markdown'])
+    assert result.exit_code == 0
+    load_config.assert_not_called()
+
+def test_view_json(mock_jira):
+    """Test JSON output is printed verbatim, without Rich markup processing"""
+    import json
+    runner = CliRunner()
+    mock_issue = Mock()
+    mock_issue.key = 'TEST-1'
+    mock_issue.fields.summary = '[bold]Not markup[/bold]'
+    mock_issue.fields.status.name = 'To Do'
+    mock_issue.fields.assignee = None
+    mock_issue.fields.created = '2024-01-01T00:00:00.000+0000'
+    mock_issue.fields.updated = '2024-01-02T00:00:00.000+0000'
+    mock_issue.fields.description = None
+    mock_jira.get_issue.return_value = mock_issue
+    
+    result = runner.invoke(cli, ['view', 'TEST-1', '--format', 'json'])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data['summary'] == '[bold]Not markup[/bold]'
+    assert data['assignee'] == 'Unassigned'
+
+def test_view_nonexistent_issue(mock_jira):
+    """Test viewing an issue that does not exist"""
+    from pyjira.exceptions import JiraApiError
+    runner = CliRunner()
+    mock_jira.get_issue.side_effect = JiraApiError("Failed to get issue FAKE-99999: Issue does not exist")
+
+    result = runner.invoke(cli, ['view', 'FAKE-99999'])
+    assert result.exit_code == 1
+    assert 'Failed to get issue FAKE-99999' in result.output
+
+def test_get_template_flat_and_nested(tmp_path, monkeypatch):
+    """Test flat templates skip YAML while typed or nested values still load as YAML"""
+    import yaml
+    from pyjira.config import get_template
+    monkeypatch.setattr('pyjira.config.jira_dir', lambda: tmp_path)
+    (tmp_path / 'templates').mkdir()
+    flat = 'summary: Fix login page\n\ncustomfield_10010: Backend team\n'
+    nested = 'issuetype:\n  name: Bug\nstory_points: 3\nurgent: yes\n'
+    (tmp_path / 'templates' / 'flat.yaml').write_text(flat)
+    (tmp_path / 'templates' / 'nested.yaml').write_text(nested)
+    
+    assert get_template('flat') == yaml.safe_load(flat)
+    assert get_template('nested') == yaml.safe_load(nested)
+    assert get_template('missing') is None
+    
+    (tmp_path / 'templates' / 'empty.yaml').write_text('')
+    assert get_template('empty') == {}
+
+def test_create_with_broken_template(mock_jira, tmp_path, monkeypatch):
+    """Test an invalid template is a configuration error and an empty one is not 'not found'"""
+    monkeypatch.setattr('pyjira.config.jira_dir', lambda: tmp_path)
+    (tmp_path / 'templates').mkdir()
+    (tmp_path / 'templates' / 'broken.yaml').write_text('summary: [unclosed\n')
+    (tmp_path / 'templates' / 'listed.yaml').write_text('- summary\n')
+    (tmp_path / 'templates' / 'empty.yaml').write_text('')
+    runner = CliRunner()
+    
+    for template in ('broken', 'listed'):
+        result = runner.invoke(cli, ['create', '--project', 'TEST', '--summary', 'Bug', '--template', template])
+        assert result.exit_code == 1
+        assert f"Failed to load template '{template}'" in result.output
+    mock_jira.create_issue.assert_not_called()
+    
+    result = runner.invoke(cli, ['create', '--project', 'TEST', '--summary', 'Bug', '--template', 'empty'])
+    assert result.exit_code == 0
+    mock_jira.create_issue.assert_called_once()
+    
+    result = runner.invoke(cli, ['create', '--project', 'TEST', '--summary', 'Bug', '--template', 'missing'])
+    assert result.exit_code == 2
+    assert "Template 'missing' not found" in result.output
+
+def test_flat_mapping_matches_yaml():
+    """Test the flat template parser either agrees with YAML or leaves the text to it"""
+    import yaml
+    from pyjira.config import _parse_flat_mapping
+    plain = [
+        'summary: Fix login page\ncustomfield_10010: Backend team\n',
+        'summary: Fix login\r\ndescription: It\'s broken, see logs/app.log\r\n',
+        'summary: Use a#b and x:y as written\n',
+    ]
+    special = [
+        'yes: text\n', 'no: text\n', 'null: text\n', '~: text\n', 'On: text\n',
+        'urgent: yes\n', 'owner: null\n', 'owner: ~\n', 'flag: Off\n',
+        'summary: Fix login # comment\n', '# comment\nsummary: Fix login\n',
+        'summary: "Fix\\tlogin\\n"\n', "summary: 'It''s broken'\n",
+        'summary: <<\n', 'points: 3\n', 'due: 2024-01-01\n', 'ratio: .inf\n',
+        'summary: Fix\tlogin\n', 'summary: Fix\u2028login\n', 'summary: Fix\x85login\n',
+        'labels: [a, b]\n', 'issuetype:\n  name: Bug\n', 'summary: a: b\n',
+    ]
+    for text in plain:
+        assert _parse_flat_mapping(text) == yaml.safe_load(text)
+    for text in special:
+        assert _parse_flat_mapping(text) is None, text
+
+def test_markdown_description_limit(monkeypatch):
+    """Test JIRA_CLI_MAX_DESCRIPTION cuts long descriptions in markdown issue views"""
+    from pyjira.cli import _formatter
+    runner = CliRunner()
+    mock_issue = Mock()
+    mock_issue.key = 'TEST-1'
+    mock_issue.fields.summary = '[bold]Not markup[/bold]'
+    mock_issue.fields.created = '2024-01-01T00:00:00.000+0000'
+    mock_issue.fields.description = 'x' * 50
+    # A mock client with the real formatter
+    mock_client = Mock()
+    mock_client.get_issue.return_value = mock_issue
+    monkeypatch.setattr('pyjira.client.JiraClient', lambda: mock_client)
+    _formatter.cache_clear()
+    
+    result = runner.invoke(cli, ['view', 'TEST-1', '--format', 'markdown'])
+    assert result.exit_code == 0
+    assert 'x' * 50 in result.output
+    assert '[bold]Not markup[/bold]' in result.output
+    
+    monkeypatch.setenv('JIRA_CLI_MAX_DESCRIPTION', '10')
+    result = runner.invoke(cli, ['view', 'TEST-1', '--format', 'markdown'])
+    assert result.exit_code == 0
+    assert 'x' * 10 + '…[truncated]' in result.output
+    assert 'x' * 11 not in result.output
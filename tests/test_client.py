@@ -0,0 +1,262 @@
+import json
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from jira.client import ResultList
+from jira.resources import Issue
+
+from pyjira import client as client_module
+from pyjira.client import JiraClient
+from pyjira.exceptions import JiraApiError
+
+
+@pytest.fixture
+def jira(monkeypatch, tmp_path):
+    """Create a real JiraClient on a mock Jira connection, caching under tmp_path"""
+    connection = MagicMock()
+    monkeypatch.setattr('pyjira.client._environment', lambda: {
+        'JIRA_SERVER': 'https://jira.example.com',
+        'JIRA_EMAIL': 'me@example.com',
+        'JIRA_API_TOKEN': 'token'
+    })
+    monkeypatch.setattr('pyjira.client._connect', lambda *args: connection)
+    monkeypatch.setattr('pyjira.client.jira_dir', lambda: tmp_path)
+    monkeypatch.delenv('JIRA_CLI_CACHE_TTL', raising=False)
+    return JiraClient(), connection
+
+def make_issues(connection, keys):
+    """Build Jira issues with the given keys"""
+    return [
+        Issue(connection._options, connection._session, raw={'key': key, 'id': key[-1], 'fields': {'summary': key}})
+        for key in keys
+    ]
+
+def cache_files(tmp_path):
+    """Get the cached search result files"""
+    cache_dir = tmp_path / '.cache'
+    return sorted(cache_dir.glob('*.json')) if cache_dir.exists() else []
+
+def test_search_cache_disabled_by_default(jira, tmp_path):
+    """Test searches are not cached unless JIRA_CLI_CACHE_TTL is set"""
+    client, connection = jira
+    connection.search_issues.return_value = ResultList(make_issues(connection, ['TEST-1']), _total=1)
+
+    client.search_issues('project = TEST')
+    client.search_issues('project = TEST')
+    assert connection.search_issues.call_count == 2
+    assert cache_files(tmp_path) == []
+
+def test_search_cache_hit(jira, tmp_path, monkeypatch):
+    """Test a repeated search is answered from a cache file only the user can read"""
+    client, connection = jira
+    monkeypatch.setenv('JIRA_CLI_CACHE_TTL', '60')
+    connection.search_issues.return_value = ResultList(make_issues(connection, ['TEST-1', 'TEST-2']), _total=2)
+
+    first = client.search_issues('project = TEST', fields=['summary'])
+    second = client.search_issues('project = TEST', fields=['summary'])
+    assert connection.search_issues.call_count == 1
+    assert [issue.key for issue in second] == [issue.key for issue in first] == ['TEST-1', 'TEST-2']
+    assert second[1].fields.summary == 'TEST-2'
+
+    [path] = cache_files(tmp_path)
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    # Different fields are a different search
+    client.search_issues('project = TEST', fields=['status'])
+    assert connection.search_issues.call_count == 2
+
+def test_search_cache_expiry(jira, tmp_path, monkeypatch):
+    """Test expired results are searched again and pruned from the cache"""
+    client, connection = jira
+    monkeypatch.setenv('JIRA_CLI_CACHE_TTL', '60')
+    connection.search_issues.return_value = ResultList(make_issues(connection, ['TEST-1']), _total=1)
+
+    client.search_issues('project = OLD')
+    [old_path] = cache_files(tmp_path)
+    expired = time.time() - 120
+    os.utime(old_path, (expired, expired))
+
+    # Writing another result prunes the expired one
+    client.search_issues('project = NEW')
+    assert not old_path.exists()
+    assert len(cache_files(tmp_path)) == 1
+
+    # An expired entry is a miss, and is deleted when read
+    [new_path] = cache_files(tmp_path)
+    os.utime(new_path, (expired, expired))
+    client.search_issues('project = NEW')
+    assert connection.search_issues.call_count == 3
+
+def test_search_cache_invalidated_by_update(jira, tmp_path, monkeypatch):
+    """Test a change made through the client drops cached search results"""
+    client, connection = jira
+    monkeypatch.setenv('JIRA_CLI_CACHE_TTL', '60')
+    connection.search_issues.return_value = ResultList(make_issues(connection, ['TEST-1']), _total=1)
+
+    client.search_issues('project = TEST')
+    client.update_issue('TEST-1', {'summary': 'Changed'})
+    assert cache_files(tmp_path) == []
+
+    client.search_issues('project = TEST')
+    assert connection.search_issues.call_count == 2
+
+def test_bulk_update_batch_reports_failed_issues(jira):
+    """Test a batch updates every issue it can and returns the errors of the rest"""
+    client, connection = jira
+    connection._get_url.side_effect = lambda path: f'https://jira.example.com/rest/api/2/{path}'
+    def put(url, data):
+        if url.endswith('TEST-2'):
+            raise RuntimeError('assignee not found')
+    connection._session.put.side_effect = put
+
+    failed = client.bulk_update_batch(make_issues(connection, ['TEST-1', 'TEST-2', 'TEST-3']), assignee='someone')
+    assert failed == {'TEST-2': 'Failed to update issue TEST-2: assignee not found'}
+    assert connection._session.put.call_count == 3
+
+def test_count_issues(jira):
+    """Test counting reads the total from a one-issue page"""
+    client, connection = jira
+    connection.search_issues.return_value = ResultList(make_issues(connection, ['TEST-1']), _total=42)
+
+    assert client.count_issues('project = TEST') == 42
+    connection.search_issues.assert_called_once_with('project = TEST', maxResults=1, fields='key')
+
+def test_iter_issues_pages(jira):
+    """Test iterating requests pages as they are consumed, for issues and raw JSON"""
+    client, connection = jira
+    issues = make_issues(connection, ['TEST-1', 'TEST-2', 'TEST-3'])
+    connection.search_issues.side_effect = [
+        ResultList(issues[:2], _total=3), ResultList(issues[2:], _startAt=2, _total=3),
+        {'issues': [issue.raw for issue in issues[:2]], 'total': 3},
+        {'issues': [issue.raw for issue in issues[2:]], 'total': 3},
+    ]
+
+    assert [issue.key for issue in client.iter_issues('project = TEST', page_size=2)] == ['TEST-1', 'TEST-2', 'TEST-3']
+    assert [raw['key'] for raw in client.iter_raw_issues('project = TEST', page_size=2)] == ['TEST-1', 'TEST-2', 'TEST-3']
+    assert [call.kwargs['startAt'] for call in connection.search_issues.call_args_list] == [0, 2, 0, 2]
+    assert [call.kwargs['json_result'] for call in connection.search_issues.call_args_list] == [False, False, True, True]
+
+def test_connection_request_timeout(monkeypatch):
+    """Test new connections bound every request, including those made from worker threads"""
+    created = MagicMock()
+    monkeypatch.setattr('jira.JIRA', created)
+    monkeypatch.setattr(client_module, '_connections', {})
+
+    monkeypatch.delenv('JIRA_CLI_TIMEOUT', raising=False)
+    client_module._connect('https://jira.example.com', 'me@example.com', 'token')
+    assert created.call_args.kwargs['timeout'] == 30.0
+
+    monkeypatch.setenv('JIRA_CLI_TIMEOUT', '5')
+    client_module._connect('https://other.example.com', 'me@example.com', 'token')
+    assert created.call_args.kwargs['timeout'] == 5.0
+
+def make_workflow_issue(connection, key, project='TEST', issuetype='1', status='10'):
+    """Build a Jira issue carrying the fields its transitions depend on"""
+    return Issue(connection._options, connection._session, raw={'key': key, 'id': key[-1], 'fields': {
+        'project': {'key': project}, 'issuetype': {'id': issuetype}, 'status': {'id': status}, 'labels': []}})
+
+def test_transitions_shared_by_workflow_state(jira):
+    """Test issues in the same project, issue type and status share one transitions lookup"""
+    client, connection = jira
+    connection.transitions.return_value = [
+        {'id': '31', 'name': 'Done', 'fields': {'labels': {}}}, {'id': '21', 'name': 'In Progress'}]
+    issues = [
+        make_workflow_issue(connection, 'TEST-1'),
+        make_workflow_issue(connection, 'TEST-2'),
+        make_workflow_issue(connection, 'TEST-3', status='20'),
+        make_workflow_issue(connection, 'TEST-4', issuetype='2'),
+        make_workflow_issue(connection, 'OTHER-5', project='OTHER'),
+        make_workflow_issue(connection, 'TEST-6'),
+    ]
+
+    assert client.bulk_update_batch(issues, status='done', add_labels='urgent') == {}
+    assert [call.args[0] for call in connection.transitions.call_args_list] == ['TEST-1', 'TEST-3', 'TEST-4', 'OTHER-5']
+    connection.transitions.assert_called_with('OTHER-5', expand='transitions.fields')
+
+    # The labels are on the Done screen, so they are set by the transition itself
+    assert connection.transition_issue.call_count == 6
+    connection.transition_issue.assert_called_with('TEST-6', '31', fields={'labels': ['urgent']})
+    connection._session.put.assert_not_called()
+
+def test_search_pages_merged_in_order(jira):
+    """Test pages requested concurrently are merged in search order, whichever returns first"""
+    client, connection = jira
+    issues = make_issues(connection, [f'TEST-{n}' for n in range(1, 10)])
+    done = {start: threading.Event() for start in range(0, 10, 2)}
+    finished = []
+    def search(jql, startAt, maxResults, fields):
+        # The server caps pages at 2 issues; each page waits for the one after
+        # it, so the pages requested concurrently finish last to first
+        if startAt and startAt + 2 in done:
+            assert done[startAt + 2].wait(5)
+        finished.append(startAt)
+        done[startAt].set()
+        return ResultList(issues[startAt:startAt + 2], _startAt=startAt, _total=len(issues))
+    connection.search_issues.side_effect = search
+
+    result = client.search_issues('project = TEST', fields=['summary'], max_workers=4)
+    assert [issue.key for issue in result] == [issue.key for issue in issues]
+    assert finished == [0, 8, 6, 4, 2]
+    assert all(
+        call.kwargs['fields'] == ['summary'] for call in connection.search_issues.call_args_list)
+
+    # max_results trims the last page
+    connection.search_issues.reset_mock()
+    assert [issue.key for issue in client.search_issues('project = TEST', max_results=5)] == [
+        'TEST-1', 'TEST-2', 'TEST-3', 'TEST-4', 'TEST-5']
+    assert sorted(call.kwargs['startAt'] for call in connection.search_issues.call_args_list) == [0, 2, 4]
+
+def test_update_issue_puts_fields(jira):
+    """Test updating an issue PUTs the fields without fetching the issue first"""
+    client, connection = jira
+    connection._get_url.side_effect = lambda path: f'https://jira.example.com/rest/api/2/{path}'
+    fields = {'summary': 'Updated summary', 'labels': ['urgent']}
+
+    client.update_issue('TEST-1', fields)
+    connection._session.put.assert_called_once_with(
+        'https://jira.example.com/rest/api/2/issue/TEST-1', data=json.dumps({'fields': fields}))
+    connection.issue.assert_not_called()
+
+    connection._session.put.side_effect = RuntimeError('Field labels cannot be set')
+    with pytest.raises(JiraApiError, match='Failed to update issue TEST-1: Field labels cannot be set'):
+        client.update_issue('TEST-1', fields)
+
+def test_add_comment_by_key(jira):
+    """Test comments are added by issue key without fetching the issue first"""
+    client, connection = jira
+
+    client.add_comment('TEST-1', 'Work in progress')
+    connection.add_comment.assert_called_once_with('TEST-1', 'Work in progress')
+    connection.issue.assert_not_called()
+
+def test_export_issues(jira, tmp_path):
+    """Test exporting writes a CSV row per issue across pages"""
+    client, connection = jira
+    fields = {'summary': 'Fix login', 'status': {'name': 'Open'}, 'priority': None, 'assignee': None,
+              'created': '2024-01-01', 'updated': '2024-01-02'}
+    connection.search_issues.return_value = {
+        'issues': [{'key': 'TEST-1', 'fields': fields}, {'key': 'TEST-2', 'fields': fields}], 'total': 2}
+    output = tmp_path / 'issues.csv'
+
+    client.export_issues('project = TEST', str(output))
+    assert output.read_text().splitlines() == [
+        'Key,Summary,Status,Priority,Assignee,Created,Updated',
+        'TEST-1,Fix login,Open,None,Unassigned,2024-01-01,2024-01-02',
+        'TEST-2,Fix login,Open,None,Unassigned,2024-01-01,2024-01-02',
+    ]
+    assert [path.name for path in tmp_path.iterdir()] == ['issues.csv']
+
+def test_export_failed_search_keeps_existing_file(jira, tmp_path):
+    """Test a failed export leaves an existing output file as it was"""
+    client, connection = jira
+    connection.search_issues.side_effect = RuntimeError('Error in the JQL Query')
+    output = tmp_path / 'issues.csv'
+    output.write_text('Key,Summary\nTEST-1,Earlier export\n')
+
+    with pytest.raises(JiraApiError, match='Failed to export issues: JQL search failed: Error in the JQL Query'):
+        client.export_issues('project = ', str(output))
+    assert output.read_text() == 'Key,Summary\nTEST-1,Earlier export\n'
+    assert [path.name for path in tmp_path.iterdir()] == ['issues.csv']